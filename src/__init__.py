@@ -2,19 +2,40 @@
 File converter package - modular document conversion system.
 """
 
+import importlib
+
 from .core.converter import ConverterFactory, DocumentConverter
-from .readers.pdf_reader import PDFReader
-from .readers.markdown_reader import MarkdownReader
-from .writers.markdown_writer import MarkdownWriter
-from .writers.docx_writer import DocxWriter
-from .writers.pdf_writer import PDFWriter
+
+# Readers and writers by extension. They are registered by import path so
+# PyMuPDF, python-docx and ReportLab are only imported when a conversion
+# actually needs them.
+_READERS = {
+    'PDFReader': ('.readers.pdf_reader', ('.pdf',)),
+    'MarkdownReader': ('.readers.markdown_reader', ('.md', '.markdown')),
+}
+_WRITERS = {
+    'MarkdownWriter': ('.writers.markdown_writer', ('.md', '.markdown')),
+    'DocxWriter': ('.writers.docx_writer', ('.docx',)),
+    'PDFWriter': ('.writers.pdf_writer', ('.pdf',)),
+}
 
 # Register readers and writers with the factory
-ConverterFactory.register_reader(PDFReader)
-ConverterFactory.register_reader(MarkdownReader)
-ConverterFactory.register_writer(MarkdownWriter)
-ConverterFactory.register_writer(DocxWriter)
-ConverterFactory.register_writer(PDFWriter)
+for _name, (_module, _extensions) in _READERS.items():
+    ConverterFactory.register_reader_lazy(_extensions, f"{__name__}{_module}:{_name}")
+for _name, (_module, _extensions) in _WRITERS.items():
+    ConverterFactory.register_writer_lazy(_extensions, f"{__name__}{_module}:{_name}")
+del _name, _module, _extensions
+
+
+def __getattr__(name):
+    """Import reader and writer classes on first attribute access."""
+    entry = _READERS.get(name) or _WRITERS.get(name)
+    if entry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(entry[0], __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'ConverterFactory',
@@ -24,4 +45,4 @@ __all__ = [
     'MarkdownWriter',
     'DocxWriter',
     'PDFWriter'
-]
\ No newline at end of file
+]
@@ -89,7 +89,7 @@ def main(input_file: Optional[Path], output: Optional[Path], output_format: Opti
 
     # Validate input file
     input_ext = detect_format_from_extension(input_file)
-    if input_ext not in ConverterFactory.get_supported_input_formats():
+    if not ConverterFactory.supports_input(input_ext):
         click.echo(f"Error: Unsupported input format '{input_ext}'. "
                   f"Use --list-formats to see supported formats.", err=True)
         sys.exit(1)
@@ -119,7 +119,7 @@ def main(input_file: Optional[Path], output: Optional[Path], output_format: Opti
                       f"file extension. Using extension: {output_ext}")
 
     # Validate output format
-    if output_ext not in ConverterFactory.get_supported_output_formats():
+    if not ConverterFactory.supports_output(output_ext):
         click.echo(f"Error: Unsupported output format '{output_ext}'. "
                   f"Use --list-formats to see supported formats.", err=True)
         sys.exit(1)
@@ -2,15 +2,23 @@
 Base converter interface and factory for document conversions.
 """
 
+import importlib
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Union, Dict, Type, Optional
+from typing import Union, Dict, Iterable, Tuple, Type, Optional
 from .document import Document
+from .extensions import file_extension
 from .footer import FooterConfig
 from ..readers.base import BaseReader
 from ..writers.base import BaseWriter
 
 
+def _suffix(path: Union[str, Path]) -> str:
+    """Return a path's extension as written, for error messages."""
+    return os.path.splitext(os.fspath(path))[1]
+
+
 class BaseConverter(ABC):
     """Abstract base class for document converters."""
 
@@ -48,20 +56,33 @@ class BaseConverter(ABC):
 class DocumentConverter(BaseConverter):
     """Standard implementation of document converter."""
 
+    def __init__(self, reader: BaseReader, writer: BaseWriter,
+                 formats_validated: bool = False):
+        """
+        Args:
+            reader: Reader for the input format
+            writer: Writer for the output format
+            formats_validated: True when reader and writer were already
+                chosen by file extension, so per-call format checks can
+                be skipped
+        """
+        super().__init__(reader, writer)
+        self.formats_validated = formats_validated
+
     def convert(self, input_path: Union[str, Path], output_path: Union[str, Path],
                 footer_config: Optional[FooterConfig] = None) -> None:
         """Convert document from input to output format."""
-        input_path = Path(input_path)
-        output_path = Path(output_path)
-
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_path}")
+        # Paths go to the reader and writer as given; both accept str or
+        # Path, so no Path is built here just for the checks
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input file not found: {os.fspath(input_path)}")
 
-        if not self.reader.supports_format(input_path):
-            raise ValueError(f"Reader does not support format: {input_path.suffix}")
+        if not self.formats_validated:
+            if not self.reader.supports_format(input_path):
+                raise ValueError(f"Reader does not support format: {_suffix(input_path)}")
 
-        if not self.writer.supports_format(output_path):
-            raise ValueError(f"Writer does not support format: {output_path.suffix}")
+            if not self.writer.supports_format(output_path):
+                raise ValueError(f"Writer does not support format: {_suffix(output_path)}")
 
         # Read document
         document = self.reader.read(input_path)
@@ -71,13 +92,11 @@ class DocumentConverter(BaseConverter):
 
     def convert_to_string(self, input_path: Union[str, Path]) -> str:
         """Convert document and return as string."""
-        input_path = Path(input_path)
-
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_path}")
+        if not os.path.exists(input_path):
+            raise FileNotFoundError(f"Input file not found: {os.fspath(input_path)}")
 
-        if not self.reader.supports_format(input_path):
-            raise ValueError(f"Reader does not support format: {input_path.suffix}")
+        if not self.formats_validated and not self.reader.supports_format(input_path):
+            raise ValueError(f"Reader does not support format: {_suffix(input_path)}")
 
         # Read document
         document = self.reader.read(input_path)
@@ -89,43 +108,108 @@ class DocumentConverter(BaseConverter):
 class ConverterFactory:
     """Factory for creating document converters."""
 
-    _readers: Dict[str, Type[BaseReader]] = {}
-    _writers: Dict[str, Type[BaseWriter]] = {}
+    # Values are classes, or "module.path:ClassName" specs not yet imported
+    _readers: Dict[str, Union[Type[BaseReader], str]] = {}
+    _writers: Dict[str, Union[Type[BaseWriter], str]] = {}
+    # Resolved (reader, writer) classes by (input ext, output ext);
+    # cleared whenever a registration changes
+    _pair_cache: Dict[Tuple[str, str], Tuple[Type[BaseReader], Type[BaseWriter]]] = {}
+    # Shared instances of stateless reader and writer classes
+    _instances: Dict[type, Union[BaseReader, BaseWriter]] = {}
 
     @classmethod
     def register_reader(cls, reader_class: Type[BaseReader]) -> None:
         """Register a reader class for its supported extensions."""
-        for ext in reader_class.get_supported_extensions():
-            cls._readers[ext.lower()] = reader_class
+        cls._readers.update(dict.fromkeys(
+            (ext.lower() for ext in reader_class.get_supported_extensions()), reader_class))
+        cls._pair_cache.clear()
 
     @classmethod
     def register_writer(cls, writer_class: Type[BaseWriter]) -> None:
         """Register a writer class for its supported extensions."""
-        for ext in writer_class.get_supported_extensions():
-            cls._writers[ext.lower()] = writer_class
+        cls._writers.update(dict.fromkeys(
+            (ext.lower() for ext in writer_class.get_supported_extensions()), writer_class))
+        cls._pair_cache.clear()
 
     @classmethod
-    def get_reader(cls, file_path: Union[str, Path]) -> BaseReader:
-        """Get appropriate reader for file format."""
-        ext = Path(file_path).suffix.lower()
+    def register_reader_lazy(cls, extensions: Iterable[str], import_spec: str) -> None:
+        """
+        Register a reader without importing it.
+
+        Args:
+            extensions: File extensions handled by the reader
+            import_spec: Reader location as "module.path:ClassName"
+        """
+        cls._readers.update(dict.fromkeys((ext.lower() for ext in extensions), import_spec))
+        cls._pair_cache.clear()
+
+    @classmethod
+    def register_writer_lazy(cls, extensions: Iterable[str], import_spec: str) -> None:
+        """
+        Register a writer without importing it.
+
+        Args:
+            extensions: File extensions handled by the writer
+            import_spec: Writer location as "module.path:ClassName"
+        """
+        cls._writers.update(dict.fromkeys((ext.lower() for ext in extensions), import_spec))
+        cls._pair_cache.clear()
+
+    @staticmethod
+    def _resolve(registry: dict, ext: str) -> type:
+        """Return the class registered for ext, importing it on first use."""
+        entry = registry[ext]
+        if isinstance(entry, str):
+            module_name, class_name = entry.split(':')
+            entry = getattr(importlib.import_module(module_name), class_name)
+            registry[ext] = entry
+        return entry
+
+    @classmethod
+    def _reader_class(cls, ext: str) -> Type[BaseReader]:
+        """Return the reader class registered for a normalized extension."""
         if ext not in cls._readers:
             raise ValueError(f"No reader registered for extension: {ext}")
-        return cls._readers[ext]()
+        return cls._resolve(cls._readers, ext)
 
     @classmethod
-    def get_writer(cls, file_path: Union[str, Path]) -> BaseWriter:
-        """Get appropriate writer for file format."""
-        ext = Path(file_path).suffix.lower()
+    def _writer_class(cls, ext: str) -> Type[BaseWriter]:
+        """Return the writer class registered for a normalized extension."""
         if ext not in cls._writers:
             raise ValueError(f"No writer registered for extension: {ext}")
-        return cls._writers[ext]()
+        return cls._resolve(cls._writers, ext)
+
+    @classmethod
+    def _instance(cls, component_class: type) -> Union[BaseReader, BaseWriter]:
+        """Return a reader or writer, reusing one instance of stateless classes."""
+        if not getattr(component_class, 'stateless', False):
+            return component_class()
+        instance = cls._instances.get(component_class)
+        if instance is None:
+            instance = cls._instances[component_class] = component_class()
+        return instance
+
+    @classmethod
+    def get_reader(cls, file_path: Union[str, Path]) -> BaseReader:
+        """Get appropriate reader for file format."""
+        return cls._instance(cls._reader_class(file_extension(file_path)))
+
+    @classmethod
+    def get_writer(cls, file_path: Union[str, Path]) -> BaseWriter:
+        """Get appropriate writer for file format."""
+        return cls._instance(cls._writer_class(file_extension(file_path)))
 
     @classmethod
     def create_converter(cls, input_path: Union[str, Path], output_path: Union[str, Path]) -> DocumentConverter:
         """Create a converter for the given input and output formats."""
-        reader = cls.get_reader(input_path)
-        writer = cls.get_writer(output_path)
-        return DocumentConverter(reader, writer)
+        key = (file_extension(input_path), file_extension(output_path))
+        pair = cls._pair_cache.get(key)
+        if pair is None:
+            pair = (cls._reader_class(key[0]), cls._writer_class(key[1]))
+            cls._pair_cache[key] = pair
+        reader_class, writer_class = pair
+        return DocumentConverter(cls._instance(reader_class), cls._instance(writer_class),
+                                 formats_validated=True)
 
     @classmethod
     def get_supported_input_formats(cls) -> list[str]:
@@ -137,6 +221,16 @@ class ConverterFactory:
         """Get list of supported output formats."""
         return list(cls._writers.keys())
 
+    @classmethod
+    def supports_input(cls, ext: str) -> bool:
+        """Check if a reader is registered for the given extension."""
+        return ext.lower() in cls._readers
+
+    @classmethod
+    def supports_output(cls, ext: str) -> bool:
+        """Check if a writer is registered for the given extension."""
+        return ext.lower() in cls._writers
+
     @classmethod
     def is_conversion_supported(cls, input_ext: str, output_ext: str) -> bool:
         """Check if conversion from input to output format is supported."""
@@ -3,10 +3,39 @@ Document model for representing structured content in a format-agnostic way.
 """
 
 from abc import ABC
-from typing import List, Optional, Any
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+class _EmptyAttributes(dict):
+    """
+    Empty, read-only attributes mapping shared by elements that set none.
+
+    Copying or pickling an element gives it a plain dict of its own, so
+    copies stay independent of the shared instance.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("shared empty attributes are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (dict, ())
+
+    def __copy__(self):
+        return {}
+
+    def __deepcopy__(self, memo):
+        return {}
+
+
+# Shared read-only attributes for elements that never set any
+_EMPTY_ATTRIBUTES = _EmptyAttributes()
+
 
 class ElementType(Enum):
     """Types of document elements."""
@@ -21,8 +50,13 @@ class ElementType(Enum):
     LINK = "link"
     IMAGE = "image"
 
+    # Members are singletons compared by identity, so the C-level identity
+    # hash is valid and avoids Enum's Python-level hash(self._name_) on
+    # every handler-table and type-index lookup
+    __hash__ = object.__hash__
 
-@dataclass
+
+@dataclass(slots=True)
 class DocumentElement(ABC):
     """Base class for all document elements."""
     content: str = ""
@@ -31,123 +65,117 @@ class DocumentElement(ABC):
 
     def __post_init__(self):
         if self.attributes is None:
+            self.attributes = _EMPTY_ATTRIBUTES
+
+    def _set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute, giving the element its own dict on first write."""
+        if self.attributes is _EMPTY_ATTRIBUTES:
             self.attributes = {}
+        self.attributes[key] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class Heading(DocumentElement):
     """Represents a heading element."""
+    element_type: ElementType = ElementType.HEADING
     level: int = 1
 
     def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.HEADING
-        self.attributes["level"] = self.level
+        DocumentElement.__post_init__(self)
+        self._set_attribute("level", self.level)
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph(DocumentElement):
     """Represents a paragraph element."""
-
-    def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.PARAGRAPH
+    element_type: ElementType = ElementType.PARAGRAPH
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentList(DocumentElement):
     """Represents a list element."""
+    element_type: ElementType = ElementType.LIST
     ordered: bool = False
     items: List["ListItem"] = None
 
     def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.LIST
-        self.attributes["ordered"] = self.ordered
+        DocumentElement.__post_init__(self)
+        self._set_attribute("ordered", self.ordered)
         if self.items is None:
             self.items = []
 
 
-@dataclass
+@dataclass(slots=True)
 class ListItem(DocumentElement):
     """Represents a list item element."""
+    element_type: ElementType = ElementType.LIST_ITEM
     children: List["DocumentList"] = None
 
     def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.LIST_ITEM
+        DocumentElement.__post_init__(self)
         if self.children is None:
             self.children = []
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlock(DocumentElement):
     """Represents a code block element."""
+    element_type: ElementType = ElementType.CODE_BLOCK
     language: Optional[str] = None
 
     def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.CODE_BLOCK
+        DocumentElement.__post_init__(self)
         if self.language:
-            self.attributes["language"] = self.language
+            self._set_attribute("language", self.language)
 
 
-@dataclass
+@dataclass(slots=True)
 class InlineCode(DocumentElement):
     """Represents inline code element."""
-
-    def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.INLINE_CODE
+    element_type: ElementType = ElementType.INLINE_CODE
 
 
-@dataclass
+@dataclass(slots=True)
 class Bold(DocumentElement):
     """Represents bold text element."""
-
-    def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.BOLD
+    element_type: ElementType = ElementType.BOLD
 
 
-@dataclass
+@dataclass(slots=True)
 class Italic(DocumentElement):
     """Represents italic text element."""
-
-    def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.ITALIC
+    element_type: ElementType = ElementType.ITALIC
 
 
-@dataclass
+@dataclass(slots=True)
 class Link(DocumentElement):
     """Represents a hyperlink element."""
+    element_type: ElementType = ElementType.LINK
     url: str = ""
     title: Optional[str] = None
 
     def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.LINK
-        self.attributes["url"] = self.url
+        DocumentElement.__post_init__(self)
+        self._set_attribute("url", self.url)
         if self.title:
-            self.attributes["title"] = self.title
+            self._set_attribute("title", self.title)
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(DocumentElement):
     """Represents an image element."""
+    element_type: ElementType = ElementType.IMAGE
     url: str = ""
     alt_text: Optional[str] = None
     title: Optional[str] = None
 
     def __post_init__(self):
-        super().__post_init__()
-        self.element_type = ElementType.IMAGE
-        self.attributes["url"] = self.url
+        DocumentElement.__post_init__(self)
+        self._set_attribute("url", self.url)
         if self.alt_text:
-            self.attributes["alt_text"] = self.alt_text
+            self._set_attribute("alt_text", self.alt_text)
         if self.title:
-            self.attributes["title"] = self.title
+            self._set_attribute("title", self.title)
 
 
 class Document:
@@ -155,14 +183,44 @@ class Document:
     Represents a structured document with various elements.
     """
 
+    __slots__ = ("title", "elements", "metadata", "_by_type", "_indexed_elements",
+                 "_indexed_count")
+
     def __init__(self, title: Optional[str] = None):
         self.title = title
         self.elements: List[DocumentElement] = []
         self.metadata: dict = {}
+        # Elements grouped by type, kept in step with add_element and
+        # rebuilt if the elements list was changed or replaced directly
+        self._by_type: Dict[ElementType, List[DocumentElement]] = {}
+        self._indexed_elements = self.elements
+        self._indexed_count = 0
 
     def add_element(self, element: DocumentElement) -> None:
         """Add an element to the document."""
         self.elements.append(element)
+        if self._indexed_elements is self.elements and \
+                self._indexed_count == len(self.elements) - 1:
+            self._by_type.setdefault(element.element_type, []).append(element)
+            self._indexed_count += 1
+
+    def _type_index(self) -> Dict[ElementType, List[DocumentElement]]:
+        """
+        Get the per-type index, rebuilding it if it no longer matches.
+
+        Elements appended, removed or a list assigned without going
+        through add_element change the list's identity or length, which
+        is checked here before the index is trusted.
+        """
+        elements = self.elements
+        if self._indexed_elements is not elements or self._indexed_count != len(elements):
+            by_type = {}
+            for element in elements:
+                by_type.setdefault(element.element_type, []).append(element)
+            self._by_type = by_type
+            self._indexed_elements = elements
+            self._indexed_count = len(elements)
+        return self._by_type
 
     def add_heading(self, text: str, level: int = 1) -> Heading:
         """Add a heading element."""
@@ -178,10 +236,10 @@ class Document:
 
     def add_list(self, items: List[str], ordered: bool = False) -> DocumentList:
         """Add a list element with items."""
-        list_element = DocumentList(ordered=ordered)
-        for item_text in items:
-            list_item = ListItem(content=item_text)
-            list_element.items.append(list_item)
+        list_element = DocumentList(
+            ordered=ordered,
+            items=[ListItem(content=item_text) for item_text in items]
+        )
         self.add_element(list_element)
         return list_element
 
@@ -193,24 +251,24 @@ class Document:
 
     def get_elements_by_type(self, element_type: ElementType) -> List[DocumentElement]:
         """Get all elements of a specific type."""
-        return [elem for elem in self.elements if elem.element_type == element_type]
+        return list(self._type_index().get(element_type, ()))
 
     def get_headings(self) -> List[Heading]:
         """Get all heading elements."""
-        return [elem for elem in self.elements if elem.element_type == ElementType.HEADING]
+        return list(self._type_index().get(ElementType.HEADING, ()))
 
     def get_text_content(self) -> str:
         """Get all text content as a single string."""
-        text_parts = []
-        for element in self.elements:
-            if element.content:
-                text_parts.append(element.content)
-        return "\n".join(text_parts)
+        return "\n".join(element.content for element in self.elements if element.content)
 
     def __len__(self) -> int:
         """Return the number of elements in the document."""
         return len(self.elements)
 
+    def __bool__(self) -> bool:
+        """Return True if the document has any elements."""
+        return bool(self.elements)
+
     def __iter__(self):
         """Iterate over document elements."""
         return iter(self.elements)
\ No newline at end of file
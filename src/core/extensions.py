@@ -0,0 +1,30 @@
+"""
+File extension lookup shared by readers, writers and the converter factory.
+"""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+
+@lru_cache(maxsize=256)
+def _lower_extension(path: str) -> str:
+    """Lower-cased extension of a path string, memoized per path."""
+    return os.path.splitext(path)[1].lower()
+
+
+def file_extension(file_path: Union[str, Path]) -> str:
+    """
+    Get the lower-cased extension of a file path.
+
+    Format checks run several times per conversion on the same paths, so
+    results are cached by path string.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        str: Extension including the dot (e.g., '.md'), or '' if none
+    """
+    return _lower_extension(os.fspath(file_path))
@@ -2,10 +2,28 @@
 Footer configuration for document conversion.
 """
 
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from string import Formatter
 from typing import Optional
 
+_FORMATTER = Formatter()
+_CONVERSIONS = {'s': str, 'r': repr, 'a': ascii}
+
+# Settings the cached footer text is rendered from; enabled and layout
+# are applied on every call, so changing them needs no invalidation
+_TEXT_FIELDS = frozenset({'left_template', 'right_template', 'date_format'})
+
+# Most page footers memoized per configuration before the memo is reset
+_PAGE_FOOTER_CACHE_SIZE = 1024
+
+
+def _format_field(value, format_spec: str, conversion: Optional[str]) -> str:
+    """Format a single replacement field the way str.format would."""
+    if conversion:
+        value = _CONVERSIONS[conversion](value)
+    return format(value, format_spec)
+
 
 @dataclass
 class FooterConfig:
@@ -16,20 +34,50 @@ class FooterConfig:
     left_template: str = "Last updated: {date}"
     right_template: str = "Page {page}"
     date_format: str = "%Y-%m-%d"
+    _date_string: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _date_day: Optional[date] = field(default=None, init=False, repr=False, compare=False)
+    _page_footers: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _compiled_templates: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate configuration after initialization."""
         if self.layout not in ["single", "double"]:
             raise ValueError(f"Invalid layout: {self.layout}. Must be 'single' or 'double'")
 
+    def __setattr__(self, name, value):
+        """Set an attribute, dropping cached footer text when its inputs change."""
+        object.__setattr__(self, name, value)
+        # The caches do not exist yet while __init__ assigns the fields
+        if name in _TEXT_FIELDS and '_page_footers' in self.__dict__:
+            object.__setattr__(self, '_page_footers', {})
+            if name == 'date_format':
+                # The date string is baked into the compiled templates
+                object.__setattr__(self, '_date_string', None)
+                object.__setattr__(self, '_compiled_templates', {})
+
+    def _refresh_date(self) -> None:
+        """Drop the date string and the text rendered from it on a new day."""
+        today = date.today()
+        if today != self._date_day:
+            self._date_day = today
+            self._date_string = None
+            self._compiled_templates = {}
+            self._page_footers = {}
+
     def get_date_string(self) -> str:
         """
         Get the formatted date string.
 
+        The date is formatted once per day, so pages share it without
+        re-formatting; changing date_format formats it again.
+
         Returns:
             str: Formatted current date
         """
-        return datetime.now().strftime(self.date_format)
+        self._refresh_date()
+        if self._date_string is None:
+            self._date_string = datetime.now().strftime(self.date_format)
+        return self._date_string
 
     def format_footer_text(self, template: str, page_number: int) -> str:
         """
@@ -42,11 +90,65 @@ class FooterConfig:
         Returns:
             str: Formatted footer text
         """
-        return template.format(
-            date=self.get_date_string(),
-            page=page_number
+        self._refresh_date()
+        try:
+            parts = self._compiled_templates[template]
+        except KeyError:
+            parts = self._compiled_templates[template] = self._compile_template(template)
+
+        if parts is None:
+            return template.format(
+                date=self.get_date_string(),
+                page=page_number
+            )
+
+        return "".join(
+            part if part.__class__ is str else _format_field(page_number, *part)
+            for part in parts
         )
 
+    def _compile_template(self, template: str) -> Optional[tuple]:
+        """
+        Split a template into literal text and {page} fields.
+
+        The date is fixed for a configuration, so {date} fields are resolved
+        here and merged into the surrounding text.
+
+        Args:
+            template: Template string with {date} and {page} placeholders
+
+        Returns:
+            Optional[tuple]: Literal strings and (format_spec, conversion)
+            pairs for the page number, or None if the template uses
+            anything str.format must handle itself
+        """
+        parts = []
+
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+            if literal:
+                parts.append(literal)
+            if field_name is None:
+                continue
+
+            if (field_name not in ("date", "page") or "{" in format_spec or
+                    (conversion and conversion not in _CONVERSIONS)):
+                return None
+
+            if field_name == "date":
+                parts.append(_format_field(self.get_date_string(), format_spec, conversion))
+            else:
+                parts.append((format_spec, conversion))
+
+        # Merge adjacent literal text
+        merged = []
+        for part in parts:
+            if merged and part.__class__ is str and merged[-1].__class__ is str:
+                merged[-1] += part
+            else:
+                merged.append(part)
+
+        return tuple(merged)
+
     def get_footer_for_page(self, page_number: int) -> tuple[str, str]:
         """
         Get left and right footer text for a given page number.
@@ -63,11 +165,17 @@ class FooterConfig:
         if not self.enabled:
             return ("", "")
 
-        left_text = self.format_footer_text(self.left_template, page_number)
-        right_text = self.format_footer_text(self.right_template, page_number)
+        self._refresh_date()
+        footer = self._page_footers.get(page_number)
+        if footer is None:
+            if len(self._page_footers) >= _PAGE_FOOTER_CACHE_SIZE:
+                self._page_footers.clear()
+            footer = self._page_footers[page_number] = (
+                self.format_footer_text(self.left_template, page_number),
+                self.format_footer_text(self.right_template, page_number),
+            )
 
         # For double-sided layout, swap on even pages
-        if self.layout == "double" and page_number % 2 == 0:
-            return (right_text, left_text)
-
-        return (left_text, right_text)
+        if not page_number & 1 and self.layout == "double":
+            return (footer[1], footer[0])
+        return footer
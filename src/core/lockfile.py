@@ -14,7 +14,7 @@ from contextlib import contextmanager
 logger = logging.getLogger(__name__)
 
 
-def get_lock_file_patterns(file_path: Union[str, Path]) -> List[Path]:
+def get_lock_file_patterns(file_path: Union[str, Path]) -> List[str]:
     """
     Get all possible lock file patterns for a given file path.
 
@@ -24,19 +24,18 @@ def get_lock_file_patterns(file_path: Union[str, Path]) -> List[Path]:
     Returns:
         List of potential lock file paths
     """
-    file_path = Path(file_path)
-    parent = file_path.parent
-    name = file_path.name
-    stem = file_path.stem
+    parent, name = os.path.split(os.fspath(file_path))
+    stem = os.path.splitext(name)[0]
+    prefix = os.path.join(parent, "")  # "" for bare file names
 
     # Common lock file patterns
     patterns = [
-        parent / f"~${name}",                    # Microsoft Office style
-        parent / f"~${name}.tmp",                # Temporary lock
-        parent / f".~lock.{name}#",              # LibreOffice style
-        parent / f"{name}.lock",                 # Simple .lock suffix
-        parent / f"~${stem}.ppwritelock",        # Custom python-pdf write lock (stem)
-        parent / f"~${name}.ppwritelock",        # Custom python-pdf write lock (full name)
+        f"{prefix}~${name}",                    # Microsoft Office style
+        f"{prefix}~${name}.tmp",                # Temporary lock
+        f"{prefix}.~lock.{name}#",              # LibreOffice style
+        f"{prefix}{name}.lock",                 # Simple .lock suffix
+        f"{prefix}~${stem}.ppwritelock",        # Custom python-pdf write lock (stem)
+        f"{prefix}~${name}.ppwritelock",        # Custom python-pdf write lock (full name)
     ]
 
     return patterns
@@ -52,15 +51,13 @@ def remove_lock_file(lock_path: Union[str, Path]) -> bool:
     Returns:
         bool: True if file was removed, False otherwise
     """
-    lock_path = Path(lock_path)
-
-    if not lock_path.exists():
-        return False
-
     try:
-        lock_path.unlink()
+        # Unlink directly; a missing file costs one failed call, not a stat too
+        os.unlink(lock_path)
         logger.debug(f"Removed lock file: {lock_path}")
         return True
+    except FileNotFoundError:
+        return False
     except PermissionError:
         logger.warning(f"Permission denied when removing lock file: {lock_path}")
         return False
@@ -79,10 +76,11 @@ def cleanup_lock_files(file_path: Union[str, Path]) -> int:
     Returns:
         int: Number of lock files removed
     """
-    patterns = get_lock_file_patterns(file_path)
     removed_count = 0
 
-    for lock_path in patterns:
+    # Unlink each candidate directly; a missing one costs a single failed
+    # call, independent of how many files share the directory
+    for lock_path in get_lock_file_patterns(file_path):
         if remove_lock_file(lock_path):
             removed_count += 1
 
@@ -4,12 +4,24 @@ Base interface for document readers.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Union
+from typing import ClassVar, Iterable, List, Union
 from ..core.document import Document
 
 
 class BaseReader(ABC):
-    """Abstract base class for document readers."""
+    """
+    Abstract base class for document readers.
+
+    Readers may be instantiated per file, so patterns and other parsing
+    tables belong at module or class scope rather than on the instance.
+
+    Attributes:
+        stateless: Set to True by readers that keep no per-read state on
+            the instance, letting ConverterFactory reuse one instance;
+            defaults to False so subclasses opt in explicitly
+    """
+
+    stateless: ClassVar[bool] = False
 
     @abstractmethod
     def read(self, source: Union[str, Path]) -> Document:
@@ -29,6 +41,21 @@ class BaseReader(ABC):
         """
         pass
 
+    def read_many(self, sources: Iterable[Union[str, Path]]) -> List[Document]:
+        """
+        Read several documents.
+
+        Readers that can batch their I/O may override this; the default
+        reads each source in turn.
+
+        Args:
+            sources: File paths to read
+
+        Returns:
+            List[Document]: Parsed documents, in the order of sources
+        """
+        return [self.read(source) for source in sources]
+
     @abstractmethod
     def supports_format(self, file_path: Union[str, Path]) -> bool:
         """
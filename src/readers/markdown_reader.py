@@ -4,34 +4,69 @@ Markdown reader implementation.
 
 import re
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from .base import BaseReader
 from ..core.document import Document
+from ..core.extensions import file_extension
+
+
+# Line patterns, compiled once and shared by every reader
+# Fence, heading and list item detection in a single match; the match's
+# lastgroup names which kind of line it is
+_LINE_RE = re.compile(
+    r'(?P<fence>```)'
+    r'|(?P<hashes>#{1,6})\s+(?P<heading>.+)$'
+    r'|(?:\*|-|\+|\d+\.)\s+(?P<item>.+)$'
+)
+_LIST_ITEM_RE = re.compile(r'^(\*|-|\+|\d+\.)\s+(.+)$')
+_INDENT_RE = re.compile(r'\s*')
 
 
 class MarkdownReader(BaseReader):
     """Reader for Markdown files."""
 
+    # Supported extensions in listing order, plus a set for dispatch checks
+    _SUPPORTED_EXTENSIONS = ('.md', '.markdown')
+    _EXTENSIONS = frozenset(_SUPPORTED_EXTENSIONS)
+    # Holds no per-call state, so ConverterFactory may share one instance
+    stateless = True
+
     def read(self, source: Union[str, Path]) -> Document:
         """Read and parse a Markdown file."""
         source = Path(source)
 
-        if not source.exists():
-            raise FileNotFoundError(f"Markdown file not found: {source}")
-
         if not self.supports_format(source):
             raise ValueError(f"Unsupported file format: {source.suffix}")
 
         try:
-            content = source.read_text(encoding='utf-8')
-            document = Document(title=source.stem)
-            self._parse_markdown_content(content, document)
-            return document
+            # Let the read report a missing file rather than stat it beforehand
+            content = source.read_bytes().decode('utf-8')
+            return self.read_string(content, title=source.stem)
 
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Markdown file not found: {source}") from None
         except Exception as e:
             raise Exception(f"Error processing Markdown: {str(e)}")
 
+    def read_string(self, content: str, title: Optional[str] = None) -> Document:
+        """
+        Parse Markdown text that is already in memory.
+
+        Args:
+            content: Markdown source text
+            title: Title for the resulting document
+
+        Returns:
+            Document: Parsed document object
+        """
+        if '\r' in content:
+            # Universal newlines, as text-mode reading would give
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        document = Document(title=title)
+        self._parse_markdown_content(content, document)
+        return document
+
     def _parse_markdown_content(self, content: str, document: Document) -> None:
         """Parse markdown content and add elements to document."""
         lines = content.split('\n')
@@ -40,17 +75,34 @@ class MarkdownReader(BaseReader):
         code_block_lines = []
         code_language = None
 
+        # Bind hot lookups once; this loop runs for every line
+        num_lines = len(lines)
+        match_line = _LINE_RE.match
+        add_paragraph = self._add_paragraph
+        add_heading = document.add_heading
+        add_code_block = document.add_code_block
+
         i = 0
-        while i < len(lines):
+        while i < num_lines:
             line = lines[i]
+
+            # Code block bodies are kept raw; only a line that could be the
+            # closing fence needs stripping and matching
+            if in_code_block and '```' not in line:
+                code_block_lines.append(line)
+                i += 1
+                continue
+
             stripped_line = line.strip()
+            line_match = match_line(stripped_line)
+            line_kind = line_match.lastgroup if line_match else None
 
             # Handle code blocks
-            if stripped_line.startswith('```'):
+            if line_kind == 'fence':
                 if not in_code_block:
                     # Start of code block
                     if current_paragraph_lines:
-                        self._add_paragraph(current_paragraph_lines, document)
+                        add_paragraph(current_paragraph_lines, document)
                         current_paragraph_lines = []
 
                     in_code_block = True
@@ -60,7 +112,7 @@ class MarkdownReader(BaseReader):
                     # End of code block
                     if code_block_lines:
                         code_content = '\n'.join(code_block_lines)
-                        document.add_code_block(code_content, code_language)
+                        add_code_block(code_content, code_language)
                     in_code_block = False
                     code_block_lines = []
                     code_language = None
@@ -73,36 +125,32 @@ class MarkdownReader(BaseReader):
                 continue
 
             # Handle headings
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', stripped_line)
-            if heading_match:
+            if line_kind == 'heading':
                 if current_paragraph_lines:
-                    self._add_paragraph(current_paragraph_lines, document)
+                    add_paragraph(current_paragraph_lines, document)
                     current_paragraph_lines = []
 
-                level = len(heading_match.group(1))
-                heading_text = heading_match.group(2).strip()
-                document.add_heading(heading_text, level)
+                level = len(line_match.group('hashes'))
+                heading_text = line_match.group('heading').strip()
+                add_heading(heading_text, level)
                 i += 1
                 continue
 
             # Handle lists - check if line is a list item
-            indent = len(line) - len(line.lstrip())
-            list_match = re.match(r'^(\*|-|\+|\d+\.)\s+(.+)$', stripped_line)
-            if list_match:
+            if line_kind == 'item':
                 if current_paragraph_lines:
-                    self._add_paragraph(current_paragraph_lines, document)
+                    add_paragraph(current_paragraph_lines, document)
                     current_paragraph_lines = []
 
                 # Parse the entire list structure starting from this line
-                list_element, lines_consumed = self._parse_list(lines[i:])
+                list_element, i = self._parse_list(lines, i)
                 document.add_element(list_element)
-                i += lines_consumed
                 continue
 
             # Handle empty lines
             if not stripped_line:
                 if current_paragraph_lines:
-                    self._add_paragraph(current_paragraph_lines, document)
+                    add_paragraph(current_paragraph_lines, document)
                     current_paragraph_lines = []
                 i += 1
                 continue
@@ -113,34 +161,38 @@ class MarkdownReader(BaseReader):
 
         # Add any remaining paragraph
         if current_paragraph_lines:
-            self._add_paragraph(current_paragraph_lines, document)
+            add_paragraph(current_paragraph_lines, document)
 
         # Handle any unclosed code block
         if in_code_block and code_block_lines:
             code_content = '\n'.join(code_block_lines)
-            document.add_code_block(code_content, code_language)
+            add_code_block(code_content, code_language)
 
-    def _parse_list(self, lines: list[str]) -> tuple:
+    def _parse_list(self, lines: list[str], start: int = 0) -> tuple:
         """
         Parse a list structure with nested items.
 
+        Args:
+            lines: All lines of the document
+            start: Index of the list's first line
+
         Returns:
-            tuple: (DocumentList element, number of lines consumed)
+            tuple: (DocumentList element, index of the first line after the list)
         """
         from ..core.document import DocumentList, ListItem
 
-        if not lines:
-            return None, 0
+        if start >= len(lines):
+            return None, start
 
         # Determine base indentation from first line
-        first_line = lines[0]
-        base_indent = len(first_line) - len(first_line.lstrip())
+        first_line = lines[start]
+        base_indent = _INDENT_RE.match(first_line).end()
 
         # Determine if ordered or unordered
         stripped_first = first_line.strip()
-        list_match = re.match(r'^(\*|-|\+|\d+\.)\s+(.+)$', stripped_first)
+        list_match = _LIST_ITEM_RE.match(stripped_first)
         if not list_match:
-            return None, 0
+            return None, start
 
         first_marker = list_match.group(1)
         is_ordered = first_marker.endswith('.')
@@ -148,7 +200,7 @@ class MarkdownReader(BaseReader):
         # Create the list
         list_element = DocumentList(ordered=is_ordered)
 
-        i = 0
+        i = start
         while i < len(lines):
             line = lines[i]
             stripped_line = line.strip()
@@ -158,7 +210,7 @@ class MarkdownReader(BaseReader):
                 break
 
             # Calculate indentation
-            indent = len(line) - len(line.lstrip())
+            indent = _INDENT_RE.match(line).end()
 
             # If indentation less than base, we're done with this list
             if indent < base_indent:
@@ -166,7 +218,7 @@ class MarkdownReader(BaseReader):
 
             # If indentation equals base, it's an item at this level
             if indent == base_indent:
-                list_match = re.match(r'^(\*|-|\+|\d+\.)\s+(.+)$', stripped_line)
+                list_match = _LIST_ITEM_RE.match(stripped_line)
                 if not list_match:
                     # Not a list item, end of list
                     break
@@ -181,15 +233,14 @@ class MarkdownReader(BaseReader):
                     next_line = lines[i]
                     next_stripped = next_line.strip()
                     if next_stripped:
-                        next_indent = len(next_line) - len(next_line.lstrip())
+                        next_indent = _INDENT_RE.match(next_line).end()
                         # If next line is indented more and is a list item, parse nested list
                         if next_indent > base_indent:
-                            next_list_match = re.match(r'^(\*|-|\+|\d+\.)\s+(.+)$', next_stripped)
+                            next_list_match = _LIST_ITEM_RE.match(next_stripped)
                             if next_list_match:
-                                nested_list, nested_consumed = self._parse_list(lines[i:])
+                                nested_list, i = self._parse_list(lines, i)
                                 if nested_list:
                                     list_item.children.append(nested_list)
-                                    i += nested_consumed
             else:
                 # Indentation is greater than base but we shouldn't be here
                 # This means it's a continuation or nested item that should have been handled
@@ -200,17 +251,16 @@ class MarkdownReader(BaseReader):
     def _add_paragraph(self, lines: list[str], document: Document) -> None:
         """Add a paragraph from collected lines."""
         if lines:
-            paragraph_text = ' '.join(lines)
-            # Basic cleanup - could be more sophisticated
-            paragraph_text = re.sub(r'\s+', ' ', paragraph_text).strip()
+            # Collapse whitespace runs; str.split() also drops the ends
+            paragraph_text = ' '.join(' '.join(lines).split())
             if paragraph_text:
                 document.add_paragraph(paragraph_text)
 
     def supports_format(self, file_path: Union[str, Path]) -> bool:
         """Check if this reader supports the given file format."""
-        return Path(file_path).suffix.lower() in ['.md', '.markdown']
+        return file_extension(file_path) in self._EXTENSIONS
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
         """Get list of supported file extensions."""
-        return ['.md', '.markdown']
\ No newline at end of file
+        return list(cls._SUPPORTED_EXTENSIONS)
\ No newline at end of file
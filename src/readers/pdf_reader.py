@@ -3,48 +3,202 @@ PDF reader implementation using PyMuPDF.
 """
 
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import Iterable, List, Optional, Tuple, Union
 import fitz  # PyMuPDF
 
 from .base import BaseReader
 from ..core.document import Document
+from ..core.extensions import file_extension
+
+
+# Heading and cleanup patterns, compiled once and shared by every reader
+# Title-like or numbered lines, matched in one pass
+_HEADING_RE = re.compile(r'[A-Z][^.]*[^.]$|\d+(\.\d+)*\.?\s+[A-Z]')
+_NUMBERED_PREFIX_RE = re.compile(r'^\d+(\.\d+)*\.?\s+')
+_SENTENCE_SPACING_RE = re.compile(r'([.!?])\s*([A-Z])')
+
+# Font size ratios (relative to the page's body text) that mark headings
+_HEADING_SIZE_RATIOS = ((1.5, 1), (1.15, 2))
+
+# Minimum pages per worker process when extracting in parallel; smaller
+# documents are extracted in-process since starting workers costs more
+_PARALLEL_PAGE_THRESHOLD = 8
+
+# PyMuPDF reports missing files with its own FileNotFoundError, which
+# derives from RuntimeError rather than the builtin
+_FILE_NOT_FOUND_ERRORS = (FileNotFoundError, fitz.FileNotFoundError)
+
+
+def _classify_heading(line: str) -> Optional[int]:
+    """
+    Classify a cleaned line as a heading.
+
+    Args:
+        line: Cleaned text line
+
+    Returns:
+        Optional[int]: Heading level, or None if the line is not a heading
+    """
+    if len(line) >= 100:
+        return None
+    if line.isupper():
+        # All caps are level 1 unless numbered
+        return 2 if _NUMBERED_PREFIX_RE.match(line) else 1
+    # Title-like and numbered headings are level 2
+    return 2 if _HEADING_RE.match(line) else None
+
+
+def _extract_page_dict(page) -> dict:
+    """Extract a page's text as a PyMuPDF "dict" without image data."""
+    # Text-only flags: image blocks would otherwise carry their full image
+    # bytes through the extraction
+    return page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+
+
+def _extract_page_range(source: str, start: int, stop: int) -> List[dict]:
+    """Extract pages [start, stop) of a PDF; runs in a worker process."""
+    with fitz.open(source) as doc:
+        return [_extract_page_dict(doc[page_num]) for page_num in range(start, stop)]
 
 
 class PDFReader(BaseReader):
     """Reader for PDF files using PyMuPDF."""
 
+    _SUPPORTED_EXTENSIONS = ('.pdf',)
+    _EXTENSIONS = frozenset(_SUPPORTED_EXTENSIONS)
+    # Holds no per-call state, so ConverterFactory may share one instance
+    stateless = True
+
+    def __init__(self, num_workers: Optional[int] = None):
+        """
+        Initialize the PDF reader.
+
+        Args:
+            num_workers: Most worker processes to extract a large PDF with;
+                by default, or with 1, pages are extracted in-process.
+                Workers reopen the file by path, so it must stay readable
+                and unchanged while it is being read
+        """
+        self.num_workers = num_workers
+
     def read(self, source: Union[str, Path]) -> Document:
         """Read and parse a PDF file."""
         source = Path(source)
 
-        if not source.exists():
-            raise FileNotFoundError(f"PDF file not found: {source}")
-
         if not self.supports_format(source):
             raise ValueError(f"Unsupported file format: {source.suffix}")
 
         try:
+            # Let open() report a missing file rather than stat it beforehand
             doc = fitz.open(source)
             document = Document(title=source.stem)
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
-
-                if text.strip():
-                    self._process_page_text(text, document)
+            for page_dict in self._extract_pages(doc, source):
+                self._process_page_dict(page_dict, document)
 
             doc.close()
             return document
 
+        except _FILE_NOT_FOUND_ERRORS:
+            raise FileNotFoundError(f"PDF file not found: {source}") from None
         except Exception as e:
             raise Exception(f"Error processing PDF: {str(e)}")
 
+    def _extract_pages(self, doc, source: Path) -> Iterable[dict]:
+        """
+        Extract the text of every page, in page order.
+
+        When num_workers allows it, large documents are split into
+        contiguous page ranges that worker processes extract in parallel,
+        each opening the file itself since PyMuPDF documents cannot be
+        shared. Otherwise pages are extracted in-process.
+        """
+        page_count = len(doc)
+        workers = min(self.num_workers or 1, page_count // _PARALLEL_PAGE_THRESHOLD)
+
+        if workers < 2:
+            return (_extract_page_dict(page) for page in doc)
+
+        bounds = [page_count * n // workers for n in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            ranges = executor.map(_extract_page_range, [str(source)] * workers,
+                                  bounds[:-1], bounds[1:])
+            return [page_dict for page_range in ranges for page_dict in page_range]
+
+    def _process_page_dict(self, page_dict: dict, document: Document) -> None:
+        """Process a PyMuPDF "dict" page extraction and add elements to document.
+
+        Lines set in a noticeably larger font than the page's body text
+        become headings. Pages without any font size variation carry no
+        structural hints, so they fall back to the text heuristics.
+        """
+        lines = self._extract_lines(page_dict)
+        if not lines:
+            return
+
+        body_size = self._body_font_size(lines)
+        if all(size == body_size for _, size in lines):
+            self._process_page_text('\n'.join(text for text, _ in lines), document)
+            return
+
+        for text, size in lines:
+            cleaned_line = self._clean_text(text)
+            level = self._heading_level_for_size(size, body_size)
+
+            if level and len(cleaned_line) < 100:
+                document.add_heading(self._format_heading_text(cleaned_line), level)
+            else:
+                document.add_paragraph(cleaned_line)
+
+    def _extract_lines(self, page_dict: dict) -> List[Tuple[str, float]]:
+        """Collect the non-empty text lines of a page with their font sizes."""
+        lines = []
+
+        for block in page_dict.get('blocks', []):
+            if block.get('type', 0) != 0:
+                continue  # Image block
+
+            for line in block.get('lines', []):
+                spans = line.get('spans', [])
+                text = ''.join(span['text'] for span in spans).strip()
+                if text:
+                    size = round(max(span['size'] for span in spans), 1)
+                    lines.append((text, size))
+
+        return lines
+
+    def _body_font_size(self, lines: List[Tuple[str, float]]) -> float:
+        """Find the font size covering the most characters on a page."""
+        sizes = Counter()
+        for text, size in lines:
+            sizes[size] += len(text)
+        return sizes.most_common(1)[0][0]
+
+    def _heading_level_for_size(self, size: float, body_size: float) -> Optional[int]:
+        """Map a line's font size to a heading level, or None for body text."""
+        for ratio, level in _HEADING_SIZE_RATIOS:
+            if size >= body_size * ratio:
+                return level
+        return None
+
     def _process_page_text(self, text: str, document: Document) -> None:
         """Process text from a PDF page and add elements to document."""
         lines = text.split('\n')
 
+        if text.lower() == text and (text.isascii() or not any(map(str.isupper, text))):
+            # Every heading and sentence-spacing check needs an uppercase
+            # letter, so a page without any is plain paragraphs. Letters
+            # such as 'ℍ' are uppercase with no lowercase form, so outside
+            # ASCII an unchanged lower() is not enough on its own
+            for line in lines:
+                cleaned_line = ' '.join(line.split())
+                if cleaned_line:
+                    document.add_paragraph(cleaned_line)
+            return
+
         for line in lines:
             line = line.strip()
             if not line:
@@ -54,32 +208,14 @@ class PDFReader(BaseReader):
             cleaned_line = self._clean_text(line)
 
             # Check if it's a heading
-            if self._is_heading(cleaned_line):
-                level = self._determine_heading_level(cleaned_line)
+            level = _classify_heading(cleaned_line)
+            if level:
                 formatted_heading = self._format_heading_text(cleaned_line)
                 document.add_heading(formatted_heading, level)
             else:
                 # Add as paragraph
                 document.add_paragraph(cleaned_line)
 
-    def _is_heading(self, line: str) -> bool:
-        """Determine if a line should be treated as a heading."""
-        return (
-            len(line) < 100 and
-            (line.isupper() or
-             bool(re.match(r'^[A-Z][^.]*[^.]$', line)) or
-             bool(re.match(r'^\d+(\.\d+)*\.?\s+[A-Z]', line)))
-        )
-
-    def _determine_heading_level(self, line: str) -> int:
-        """Determine the heading level based on line characteristics."""
-        if re.match(r'^\d+(\.\d+)*\.?\s+', line):
-            return 2  # Numbered headings are level 2
-        elif line.isupper():
-            return 1  # All caps are level 1
-        else:
-            return 2  # Default to level 2
-
     def _format_heading_text(self, line: str) -> str:
         """Format heading text for better readability."""
         if line.isupper():
@@ -88,17 +224,16 @@ class PDFReader(BaseReader):
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Normalize whitespace (str.split also trims both ends)
+        text = ' '.join(text.split())
         # Fix spacing around punctuation
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
-        return text.strip()
+        return _SENTENCE_SPACING_RE.sub(r'\1 \2', text)
 
     def supports_format(self, file_path: Union[str, Path]) -> bool:
         """Check if this reader supports the given file format."""
-        return Path(file_path).suffix.lower() == '.pdf'
+        return file_extension(file_path) in self._EXTENSIONS
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
         """Get list of supported file extensions."""
-        return ['.pdf']
\ No newline at end of file
+        return list(cls._SUPPORTED_EXTENSIONS)
\ No newline at end of file
@@ -4,13 +4,22 @@ Base interface for document writers.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Union, Optional
+from typing import ClassVar, Union, Optional
 from ..core.document import Document
 from ..core.footer import FooterConfig
 
 
 class BaseWriter(ABC):
-    """Abstract base class for document writers."""
+    """
+    Abstract base class for document writers.
+
+    Attributes:
+        stateless: Set to True by writers that keep no per-write state on
+            the instance, letting ConverterFactory reuse one instance;
+            defaults to False so subclasses opt in explicitly
+    """
+
+    stateless: ClassVar[bool] = False
 
     @abstractmethod
     def write(self, document: Document, output_path: Union[str, Path],
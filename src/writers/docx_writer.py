@@ -2,6 +2,7 @@
 DOCX writer implementation using python-docx.
 """
 
+from collections import Counter
 from pathlib import Path
 from typing import Union, Optional
 from docx import Document as DocxDocument
@@ -10,13 +11,31 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from .base import BaseWriter
 from ..core.document import Document, ElementType
+from ..core.extensions import file_extension
 from ..core.footer import FooterConfig
 from ..core.lockfile import cleanup_lock_files
 
+# Hanging indent that pulls a list item's bullet out to the left margin
+_LIST_FIRST_LINE_INDENT = Inches(-0.25)
+
 
 class DocxWriter(BaseWriter):
     """Writer for DOCX files using python-docx."""
 
+    _SUPPORTED_EXTENSIONS = ('.docx',)
+    _EXTENSIONS = frozenset(_SUPPORTED_EXTENSIONS)
+    # Holds no per-call state, so ConverterFactory may share one instance
+    stateless = True
+
+    def __init__(self):
+        # Element handlers by type, bound once per writer
+        self._element_handlers = {
+            ElementType.HEADING: self._add_heading_to_docx,
+            ElementType.PARAGRAPH: self._add_paragraph_to_docx,
+            ElementType.LIST: self._add_list_to_docx,
+            ElementType.CODE_BLOCK: self._add_code_block_to_docx,
+        }
+
     def write(self, document: Document, output_path: Union[str, Path],
               footer_config: Optional[FooterConfig] = None) -> None:
         """Write a document to a DOCX file."""
@@ -51,13 +70,8 @@ class DocxWriter(BaseWriter):
 
         parts.append(f"Elements: {len(document.elements)}")
 
-        element_counts = {}
-        for element in document.elements:
-            element_type = element.element_type.value
-            element_counts[element_type] = element_counts.get(element_type, 0) + 1
-
-        for element_type, count in element_counts.items():
-            parts.append(f"  {element_type}: {count}")
+        element_counts = Counter(element.element_type.value for element in document.elements)
+        parts.extend(f"  {element_type}: {count}" for element_type, count in element_counts.items())
 
         return "\n".join(parts)
 
@@ -68,7 +82,7 @@ class DocxWriter(BaseWriter):
 
         # Add title if present
         if document.title:
-            title = docx_doc.add_heading(document.title, level=0)
+            docx_doc.add_heading(document.title, level=0)
 
         # Process each element
         for element in document.elements:
@@ -119,12 +133,15 @@ class DocxWriter(BaseWriter):
         # Get the footer text for this page type
         left_text, right_text = footer_config.get_footer_for_page(page_number)
 
-        # Clear any existing content
-        for paragraph in footer.paragraphs:
-            paragraph.clear()
+        # Clear any existing content; a new footer holds a single empty
+        # paragraph, which needs no clearing
+        paragraphs = footer.paragraphs
+        if len(paragraphs) != 1 or paragraphs[0].text:
+            for paragraph in paragraphs:
+                paragraph.clear()
 
         # Add paragraph with tab stops for alignment
-        para = footer.paragraphs[0] if footer.paragraphs else footer.add_paragraph()
+        para = paragraphs[0] if paragraphs else footer.add_paragraph()
 
         # Add left-aligned text
         run_left = para.add_run(left_text)
@@ -134,27 +151,20 @@ class DocxWriter(BaseWriter):
         # Note: We use a simple approach with tabs. For page numbers in DOCX,
         # we'll use the placeholder text since actual page numbers would require
         # field codes which are more complex.
-        para.add_run('\t' + right_text)
-        para.runs[1].font.size = Pt(9)
+        run_right = para.add_run('\t' + right_text)
+        run_right.font.size = Pt(9)
 
         # Set tab stop for right alignment
-        from docx.shared import RGBColor
         para.paragraph_format.tab_stops.add_tab_stop(Inches(6.0), WD_ALIGN_PARAGRAPH.RIGHT)
 
     def _add_element_to_docx(self, element, docx_doc: DocxDocument) -> None:
         """Add a document element to the DOCX document."""
-        if element.element_type == ElementType.HEADING:
-            self._add_heading_to_docx(element, docx_doc)
-        elif element.element_type == ElementType.PARAGRAPH:
-            self._add_paragraph_to_docx(element, docx_doc)
-        elif element.element_type == ElementType.LIST:
-            self._add_list_to_docx(element, docx_doc)
-        elif element.element_type == ElementType.CODE_BLOCK:
-            self._add_code_block_to_docx(element, docx_doc)
-        else:
+        handler = self._element_handlers.get(element.element_type)
+        if handler is not None:
+            handler(element, docx_doc)
+        elif element.content:
             # Fallback: treat as paragraph
-            if element.content:
-                docx_doc.add_paragraph(element.content)
+            docx_doc.add_paragraph(element.content)
 
     def _add_heading_to_docx(self, heading, docx_doc: DocxDocument) -> None:
         """Add a heading element to DOCX."""
@@ -176,15 +186,17 @@ class DocxWriter(BaseWriter):
             docx_doc: The python-docx Document object
             indent_level: Current nesting level (0 = top level)
         """
-        if not hasattr(list_element, 'items') or not list_element.items:
+        if not list_element.items:
             return
 
         # python-docx doesn't have built-in list support, so we'll simulate it
         # with indented paragraphs
         is_ordered = list_element.attributes.get('ordered', False)
 
-        # Calculate indentation based on nesting level
+        # Calculate indentation based on nesting level; it is the same
+        # for every item, so convert it once
         base_indent = 0.25 + (indent_level * 0.5)  # Increase indent for each level
+        left_indent = Inches(base_indent)
 
         for i, item in enumerate(list_element.items, 1):
             if is_ordered:
@@ -193,12 +205,13 @@ class DocxWriter(BaseWriter):
                 bullet = "•"
 
             para = docx_doc.add_paragraph()
-            para.paragraph_format.left_indent = Inches(base_indent)
-            para.paragraph_format.first_line_indent = Inches(-0.25)
-            run = para.add_run(f"{bullet} {item.content}")
+            paragraph_format = para.paragraph_format
+            paragraph_format.left_indent = left_indent
+            paragraph_format.first_line_indent = _LIST_FIRST_LINE_INDENT
+            para.add_run(f"{bullet} {item.content}")
 
             # Process nested children if any
-            if hasattr(item, 'children') and item.children:
+            if item.children:
                 for child_list in item.children:
                     self._add_list_to_docx(child_list, docx_doc, indent_level + 1)
 
@@ -223,9 +236,9 @@ class DocxWriter(BaseWriter):
 
     def supports_format(self, file_path: Union[str, Path]) -> bool:
         """Check if this writer supports the given file format."""
-        return Path(file_path).suffix.lower() == '.docx'
+        return file_extension(file_path) in self._EXTENSIONS
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
         """Get list of supported file extensions."""
-        return ['.docx']
\ No newline at end of file
+        return list(cls._SUPPORTED_EXTENSIONS)
\ No newline at end of file
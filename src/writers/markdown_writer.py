@@ -3,17 +3,35 @@ Markdown writer implementation.
 """
 
 from pathlib import Path
-from typing import Union, Optional
+from typing import Iterator, Union, Optional
 
 from .base import BaseWriter
 from ..core.document import Document, ElementType
+from ..core.extensions import file_extension
 from ..core.footer import FooterConfig
 from ..core.lockfile import cleanup_lock_files
 
+# Heading markers for the standard levels, indexed by level
+_HEADING_PREFIXES = tuple('#' * level for level in range(7))
+
 
 class MarkdownWriter(BaseWriter):
     """Writer for Markdown files."""
 
+    _SUPPORTED_EXTENSIONS = ('.md', '.markdown')
+    _EXTENSIONS = frozenset(_SUPPORTED_EXTENSIONS)
+    # Holds no per-call state, so ConverterFactory may share one instance
+    stateless = True
+
+    def __init__(self):
+        # Element converters by type, bound once per writer
+        self._element_converters = {
+            ElementType.HEADING: self._convert_heading,
+            ElementType.PARAGRAPH: self._convert_paragraph,
+            ElementType.LIST: self._convert_list,
+            ElementType.CODE_BLOCK: self._convert_code_block,
+        }
+
     def write(self, document: Document, output_path: Union[str, Path],
               footer_config: Optional[FooterConfig] = None) -> None:
         """
@@ -29,8 +47,15 @@ class MarkdownWriter(BaseWriter):
                            f"{output_path.suffix}")
 
         try:
-            markdown_content = self.to_string(document)
-            output_path.write_text(markdown_content, encoding='utf-8')
+            if not isinstance(document, Document):
+                raise ValueError("Input must be a Document object")
+
+            # Render and encode everything before opening the target, so a
+            # conversion error leaves any existing file untouched; the
+            # target is then written in place, keeping symlinks, hard
+            # links, ownership and permissions as they were
+            data = "".join(self._iter_markdown(document)).encode('utf-8')
+            output_path.write_bytes(data)
         except Exception as e:
             raise IOError(f"Error writing to file {output_path}: {str(e)}")
         finally:
@@ -42,78 +67,103 @@ class MarkdownWriter(BaseWriter):
         if not isinstance(document, Document):
             raise ValueError("Input must be a Document object")
 
-        markdown_parts = []
+        return "".join(self._iter_markdown(document))
+
+    def _iter_markdown(self, document: Document) -> Iterator[str]:
+        """
+        Generate the Markdown text of a document in order.
+
+        Args:
+            document: Document to convert
+
+        Yields:
+            str: Consecutive pieces of the Markdown output, separators included
+        """
+        separator = ""
 
         # Add title if present
         if document.title:
-            markdown_parts.append(f"# {document.title}\n")
+            yield f"# {document.title}\n"
+            separator = "\n\n"
 
         # Process each element
         for element in document.elements:
             markdown_text = self._convert_element(element)
             if markdown_text:
-                markdown_parts.append(markdown_text)
-
-        return "\n\n".join(markdown_parts)
+                yield separator
+                yield markdown_text
+                separator = "\n\n"
 
     def _convert_element(self, element) -> str:
         """Convert a document element to Markdown."""
-        if element.element_type == ElementType.HEADING:
-            return self._convert_heading(element)
-        elif element.element_type == ElementType.PARAGRAPH:
-            return self._convert_paragraph(element)
-        elif element.element_type == ElementType.LIST:
-            return self._convert_list(element)
-        elif element.element_type == ElementType.CODE_BLOCK:
-            return self._convert_code_block(element)
-        else:
-            # Fallback for unknown element types
-            return element.content if element.content else ""
+        converter = self._element_converters.get(element.element_type)
+        if converter is not None:
+            return converter(element)
+        # Fallback for unknown element types
+        return element.content if element.content else ""
 
     def _convert_heading(self, heading) -> str:
         """Convert a heading element to Markdown."""
         level = heading.attributes.get('level', 1)
-        prefix = '#' * level
+        prefix = _HEADING_PREFIXES[level] if 1 <= level <= 6 else '#' * level
         return f"{prefix} {heading.content}"
 
     def _convert_paragraph(self, paragraph) -> str:
         """Convert a paragraph element to Markdown."""
         return paragraph.content
 
-    def _convert_list(self, list_element, indent_level=0) -> str:
+    def _convert_list(self, list_element) -> str:
+        """Convert a list element to Markdown with support for nested lists."""
+        markdown_lines = []
+        self._append_list_lines(list_element, markdown_lines)
+        return "\n".join(markdown_lines)
+
+    def _append_list_lines(self, list_element, markdown_lines: list) -> None:
         """
-        Convert a list element to Markdown with support for nested lists.
+        Append the Markdown lines of a list, nested lists included.
+
+        Nested lists are walked with an explicit stack rather than by
+        recursion, so deep nesting cannot hit the interpreter's recursion
+        limit. Every level appends to the same list of lines.
 
         Args:
             list_element: The DocumentList to convert
-            indent_level: Current indentation level (2 spaces per level)
-
-        Returns:
-            String representation of the list in Markdown format
+            markdown_lines: Lines of the list converted so far
         """
-        if not hasattr(list_element, 'items') or not list_element.items:
-            return ""
-
-        is_ordered = list_element.attributes.get('ordered', False)
-        markdown_lines = []
-
-        indent = "  " * indent_level  # 2 spaces per indent level
-
-        for i, item in enumerate(list_element.items, 1):
-            if is_ordered:
-                prefix = f"{i}."
+        # Each entry is a list still being converted: its remaining
+        # (number, item) pairs, whether it is ordered and its indent
+        stack = []
+
+        def push(nested_list, indent_level):
+            if not nested_list.items:
+                return
+            is_ordered = nested_list.attributes.get('ordered', False)
+            indent = "  " * indent_level  # 2 spaces per indent level
+            stack.append((enumerate(nested_list.items, 1), is_ordered, indent, indent_level))
+
+        push(list_element, 0)
+
+        while stack:
+            items, is_ordered, indent, indent_level = stack[-1]
+
+            for i, item in items:
+                if is_ordered:
+                    prefix = f"{i}."
+                else:
+                    prefix = "-"
+                markdown_lines.append(f"{indent}{prefix} {item.content}")
+
+                # Convert nested children before the next item; push them
+                # in reverse so the first child list is converted first
+                if item.children:
+                    depth = len(stack)
+                    for child_list in reversed(item.children):
+                        push(child_list, indent_level + 1)
+                    if len(stack) > depth:
+                        break
             else:
-                prefix = "-"
-            markdown_lines.append(f"{indent}{prefix} {item.content}")
-
-            # Process nested children if any
-            if hasattr(item, 'children') and item.children:
-                for child_list in item.children:
-                    nested_markdown = self._convert_list(child_list, indent_level + 1)
-                    if nested_markdown:
-                        markdown_lines.append(nested_markdown)
-
-        return "\n".join(markdown_lines)
+                # This list is finished
+                stack.pop()
 
     def _convert_code_block(self, code_block) -> str:
         """Convert a code block element to Markdown."""
@@ -125,9 +175,9 @@ class MarkdownWriter(BaseWriter):
 
     def supports_format(self, file_path: Union[str, Path]) -> bool:
         """Check if this writer supports the given file format."""
-        return Path(file_path).suffix.lower() in ['.md', '.markdown']
+        return file_extension(file_path) in self._EXTENSIONS
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
         """Get list of supported file extensions."""
-        return ['.md', '.markdown']
\ No newline at end of file
+        return list(cls._SUPPORTED_EXTENSIONS)
\ No newline at end of file
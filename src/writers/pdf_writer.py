@@ -2,8 +2,13 @@
 PDF writer implementation using ReportLab.
 """
 
+from collections import Counter, deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional
+import os
+import re
+import threading
 import warnings
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -11,67 +16,167 @@ from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT
 from reportlab.platypus import (
     BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer,
-    ListFlowable, ListItem, Preformatted
+    ListFlowable, Preformatted
 )
+from reportlab.platypus.paragraph import cleanBlockQuotedText
+from reportlab.platypus.paraparser import ParaParser
 from reportlab.lib.fonts import addMapping
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
 from .base import BaseWriter
 from ..core.document import Document, ElementType
+from ..core.extensions import file_extension
 from ..core.footer import FooterConfig
 from ..core.lockfile import cleanup_lock_files
 
+# Vertical space after the title and after each element. A fresh Spacer is
+# needed for every gap: ReportLab marks a flowable it pushes to the next
+# frame, so one instance cannot appear at several places in a story
+_TITLE_SPACE = 0.2 * inch
+_ELEMENT_SPACE = 0.1 * inch
+
+# ReportLab heading styles, indexed by heading level - 1
+_HEADING_STYLE_NAMES = ('Heading1', 'Heading2', 'Heading3',
+                        'Heading4', 'Heading5', 'Heading6')
+
+
+# Characters that can start markup or an entity in Paragraph text
+_MARKUP_RE = re.compile(r'[<&]')
+
+
+@lru_cache(maxsize=32)
+def _plain_text_frag(style):
+    """
+    Parse a placeholder once to get the text fragment a style produces.
+
+    Args:
+        style: ReportLab paragraph style
+
+    Returns:
+        ParaFrag: Fragment carrying the style's font and colour attributes
+    """
+    _, frags, _ = ParaParser().parse('x', style)
+    return frags[0]
+
+
+def _make_paragraph(text, style):
+    """
+    Create a Paragraph, skipping the markup parser for plain text.
+
+    Text without '<' or '&' parses to a single fragment whose attributes
+    depend only on the style, so a copy of that style's fragment is
+    passed to Paragraph instead of running the XML parser again.
+
+    Args:
+        text: Paragraph text, possibly containing ReportLab markup
+        style: ReportLab paragraph style
+
+    Returns:
+        Paragraph: The paragraph flowable
+    """
+    if _MARKUP_RE.search(text) or getattr(style, 'textTransform', None):
+        return Paragraph(text, style)
+    text = cleanBlockQuotedText(text)
+    if not text:
+        return Paragraph(text, style)
+    return Paragraph(text, style, frags=[_plain_text_frag(style).clone(text=text)])
+
+
+# Common font paths across different operating systems
+_UNICODE_FONT_PATHS = (
+    # Linux
+    '/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf',
+    # macOS
+    '/Library/Fonts/DejaVuSansMono.ttf',
+    '/System/Library/Fonts/DejaVuSansMono.ttf',
+    # Windows (if installed)
+    'C:/Windows/Fonts/DejaVuSansMono.ttf',
+    # Bundled with application
+    Path(__file__).parent.parent / 'fonts' / 'DejaVuSansMono.ttf',
+)
+
+# ReportLab's font registry is process-wide; the lock also makes racing
+# first writers wait for one probe instead of each parsing the font
+_FONT_REGISTRATION_LOCK = threading.Lock()
+
+
+def _resolve_unicode_font() -> str:
+    """
+    Get the Unicode-capable monospace font registered with ReportLab.
+
+    The font paths are probed once per process; later writers reuse
+    the result, and writers created concurrently wait for it.
+
+    Returns:
+        str: The font name to use for code blocks, or 'Courier' as fallback
+    """
+    with _FONT_REGISTRATION_LOCK:
+        return _register_unicode_font()
+
+
+@lru_cache(maxsize=1)
+def _register_unicode_font() -> str:
+    """
+    Probe the font paths and register the first usable font.
+
+    Called only with _FONT_REGISTRATION_LOCK held.
+
+    Returns:
+        str: The font name to use for code blocks, or 'Courier' as fallback
+    """
+    for font_path in _UNICODE_FONT_PATHS:
+        font_path = Path(font_path)
+        if font_path.is_file():
+            try:
+                pdfmetrics.registerFont(TTFont('DejaVuSansMono', str(font_path)))
+                return 'DejaVuSansMono'
+            except Exception as e:
+                warnings.warn(f"Failed to register font {font_path}: {e}")
+
+    # Fallback to Courier with warning
+    warnings.warn(
+        "DejaVu Sans Mono font not found. Unicode characters in code blocks "
+        "may not render correctly. Using Courier as fallback."
+    )
+    return 'Courier'
+
+
+@lru_cache(maxsize=1)
+def _get_style_sheet():
+    """
+    Get the sample style sheet shared by every PDF written.
+
+    Building it creates a few dozen styles; the writer only reads them,
+    so one sheet serves all documents in the process.
+    """
+    return getSampleStyleSheet()
+
 
 class PDFWriter(BaseWriter):
     """Writer for PDF files using ReportLab."""
 
-    # Class-level flag to track font registration
-    _font_registered = False
-    _unicode_font_name = None
+    _SUPPORTED_EXTENSIONS = ('.pdf',)
+    _EXTENSIONS = frozenset(_SUPPORTED_EXTENSIONS)
+    # Holds no per-call state, so ConverterFactory may share one instance
+    stateless = True
 
     def __init__(self):
         """Initialize PDF writer and register Unicode-capable fonts."""
         super().__init__()
-        if not PDFWriter._font_registered:
-            PDFWriter._unicode_font_name = self._register_unicode_font()
-            PDFWriter._font_registered = True
-
-    def _register_unicode_font(self) -> str:
-        """
-        Register a Unicode-capable monospace font with ReportLab.
-
-        Returns:
-            str: The font name to use for code blocks, or 'Courier' as fallback
-        """
-        # Common font paths across different operating systems
-        font_paths = [
-            # Linux
-            '/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf',
-            # macOS
-            '/Library/Fonts/DejaVuSansMono.ttf',
-            '/System/Library/Fonts/DejaVuSansMono.ttf',
-            # Windows (if installed)
-            'C:/Windows/Fonts/DejaVuSansMono.ttf',
-            # Bundled with application
-            Path(__file__).parent.parent / 'fonts' / 'DejaVuSansMono.ttf',
-        ]
-
-        for font_path in font_paths:
-            font_path = Path(font_path)
-            if font_path.exists():
-                try:
-                    pdfmetrics.registerFont(TTFont('DejaVuSansMono', str(font_path)))
-                    return 'DejaVuSansMono'
-                except Exception as e:
-                    warnings.warn(f"Failed to register font {font_path}: {e}")
-
-        # Fallback to Courier with warning
-        warnings.warn(
-            "DejaVu Sans Mono font not found. Unicode characters in code blocks "
-            "may not render correctly. Using Courier as fallback."
-        )
-        return 'Courier'
+        # Code block and heading styles, looked up once per style sheet
+        self._code_style = None
+        self._code_style_sheet = None
+        self._heading_styles = ()
+        self._heading_style_sheet = None
+        self._unicode_font_name = _resolve_unicode_font()
+        # Element converters by type, bound once per writer
+        self._element_converters = {
+            ElementType.HEADING: self._convert_heading,
+            ElementType.PARAGRAPH: self._convert_paragraph,
+            ElementType.LIST: self._convert_list,
+            ElementType.CODE_BLOCK: self._convert_code_block,
+        }
 
     def write(self, document: Document, output_path: Union[str, Path],
               footer_config: Optional[FooterConfig] = None) -> None:
@@ -106,13 +211,8 @@ class PDFWriter(BaseWriter):
 
         parts.append(f"Elements: {len(document.elements)}")
 
-        element_counts = {}
-        for element in document.elements:
-            element_type = element.element_type.value
-            element_counts[element_type] = element_counts.get(element_type, 0) + 1
-
-        for element_type, count in element_counts.items():
-            parts.append(f"  {element_type}: {count}")
+        element_counts = Counter(element.element_type.value for element in document.elements)
+        parts.extend(f"  {element_type}: {count}" for element_type, count in element_counts.items())
 
         return "\n".join(parts)
 
@@ -124,7 +224,7 @@ class PDFWriter(BaseWriter):
 
         # Create the PDF document
         pdf_doc = BaseDocTemplate(
-            str(output_path),
+            os.fspath(output_path),
             pagesize=letter,
             rightMargin=72,
             leftMargin=72,
@@ -141,38 +241,40 @@ class PDFWriter(BaseWriter):
             id='normal'
         )
 
-        # Create page template with footer callback
-        def add_page_footer(canvas, doc):
-            """Add footer to page if configured."""
-            if footer_config and footer_config.enabled:
+        # Create page template, with a footer callback only when footers
+        # are enabled; positions and lookups are bound once per document
+        if footer_config and footer_config.enabled:
+            get_footer = footer_config.get_footer_for_page
+            left_x = pdf_doc.leftMargin
+            right_x = pdf_doc.width + pdf_doc.leftMargin
+
+            def add_page_footer(canvas, doc):
+                """Add footer to page."""
                 canvas.saveState()
-                page_num = canvas.getPageNumber()
-                left_text, right_text = footer_config.get_footer_for_page(page_num)
+                left_text, right_text = get_footer(canvas.getPageNumber())
 
                 # Draw left footer text
                 canvas.setFont('Helvetica', 9)
-                canvas.drawString(doc.leftMargin, 24, left_text)
+                canvas.drawString(left_x, 24, left_text)
 
                 # Draw right footer text
-                canvas.drawRightString(
-                    doc.width + doc.leftMargin,
-                    24,
-                    right_text
-                )
+                canvas.drawRightString(right_x, 24, right_text)
                 canvas.restoreState()
 
-        template = PageTemplate(id='main', frames=[frame], onPage=add_page_footer)
+            template = PageTemplate(id='main', frames=[frame], onPage=add_page_footer)
+        else:
+            template = PageTemplate(id='main', frames=[frame])
         pdf_doc.addPageTemplates([template])
 
         # Get styles
-        styles = getSampleStyleSheet()
+        styles = _get_style_sheet()
         story = []
 
         # Add title if present
         if document.title:
             title_style = styles['Title']
-            story.append(Paragraph(document.title, title_style))
-            story.append(Spacer(1, 0.2 * inch))
+            story.append(_make_paragraph(document.title, title_style))
+            story.append(Spacer(1, _TITLE_SPACE))
 
         # Process each element
         for element in document.elements:
@@ -183,126 +285,150 @@ class PDFWriter(BaseWriter):
                 else:
                     story.append(flowables)
                 # Add spacing after each element
-                story.append(Spacer(1, 0.1 * inch))
+                story.append(Spacer(1, _ELEMENT_SPACE))
 
         # Build the PDF
         pdf_doc.build(story)
 
     def _convert_element_to_flowable(self, element, styles):
         """Convert a document element to ReportLab flowables."""
-        if element.element_type == ElementType.HEADING:
-            return self._convert_heading(element, styles)
-        elif element.element_type == ElementType.PARAGRAPH:
-            return self._convert_paragraph(element, styles)
-        elif element.element_type == ElementType.LIST:
-            return self._convert_list(element, styles)
-        elif element.element_type == ElementType.CODE_BLOCK:
-            return self._convert_code_block(element, styles)
-        else:
-            # Fallback for unknown element types
-            if element.content:
-                return Paragraph(element.content, styles['Normal'])
-            return None
+        converter = self._element_converters.get(element.element_type)
+        if converter is not None:
+            return converter(element, styles)
+        # Fallback for unknown element types
+        if element.content:
+            return _make_paragraph(element.content, styles['Normal'])
+        return None
 
     def _convert_heading(self, heading, styles):
         """Convert a heading element to PDF."""
+        heading_styles = self._get_heading_styles(styles)
         level = heading.attributes.get('level', 1)
+        # Levels outside 1-6 fall back to the smallest heading style
+        style = heading_styles[level - 1] if 1 <= level <= 6 else heading_styles[-1]
 
-        # Map heading levels to ReportLab styles
-        style_map = {
-            1: 'Heading1',
-            2: 'Heading2',
-            3: 'Heading3',
-            4: 'Heading4',
-            5: 'Heading5',
-            6: 'Heading6'
-        }
-
-        style_name = style_map.get(level, 'Heading6')
-        style = styles[style_name]
-
-        return Paragraph(heading.content, style)
+        return _make_paragraph(heading.content, style)
 
     def _convert_paragraph(self, paragraph, styles):
         """Convert a paragraph element to PDF."""
-        return Paragraph(paragraph.content, styles['Normal'])
+        return _make_paragraph(paragraph.content, styles['Normal'])
 
     def _convert_list(self, list_element, styles, base_indent=20):
         """
         Convert a list element to PDF, with support for nested lists.
 
+        The list becomes a single ListFlowable. Each item's entry holds its
+        paragraph followed by the ListFlowables of its nested lists, so
+        ReportLab numbers and indents the whole tree itself.
+
         Args:
             list_element: The DocumentList to convert
             styles: ReportLab style sheet
-            base_indent: Base indentation level in points
+            base_indent: Indentation of the outermost list in points
 
         Returns:
             List of flowables representing the list structure
         """
-        if not hasattr(list_element, 'items') or not list_element.items:
+        if not list_element.items:
             return None
 
-        is_ordered = list_element.attributes.get('ordered', False)
-
-        # Create flowables list to return
-        flowables = []
-
-        # Process each item
-        for i, item in enumerate(list_element.items, 1):
-            if is_ordered:
-                bullet_text = f"{i}."
-            else:
-                bullet_text = "•"
-
-            # Create paragraph for list item content
-            item_para = Paragraph(item.content, styles['Normal'])
-
-            # Create list item with proper indentation
-            list_item_flowable = ListFlowable(
-                [ListItem(item_para, bulletText=bullet_text, leftIndent=base_indent)],
-                bulletType='bullet' if not is_ordered else '1',
-                start=i if is_ordered else None,
-                leftIndent=base_indent,
+        item_style = styles['Normal']
+
+        # Breadth-first order puts every list before the lists nested in
+        # it, so building in reverse has each nested list ready for its
+        # parent without recursing
+        lists = []
+        pending = deque([list_element])
+        while pending:
+            current = pending.popleft()
+            lists.append(current)
+            for item in current.items:
+                pending.extend(item.children)
+
+        flowables_by_list = {}
+        for current in reversed(lists):
+            if not current.items:
+                continue
+
+            entries = []
+            for item in current.items:
+                # Only the first flowable of an entry gets the bullet
+                entry = [_make_paragraph(item.content, item_style)]
+                for child_list in item.children:
+                    nested = flowables_by_list.get(id(child_list))
+                    if nested is not None:
+                        entry.append(nested)
+                entries.append(entry)
+
+            is_ordered = current.attributes.get('ordered', False)
+
+            # The list draws the bullet itself: the item's number for
+            # ordered lists, a bullet character otherwise. Nested lists
+            # are indented relative to their parent item
+            flowables_by_list[id(current)] = ListFlowable(
+                entries,
+                bulletType='1' if is_ordered else 'bullet',
+                start=1 if is_ordered else None,
+                leftIndent=base_indent if current is list_element else 30,
                 bulletFontName='Helvetica',
                 bulletFontSize=10
             )
-            flowables.append(list_item_flowable)
 
-            # Process nested children if any
-            if hasattr(item, 'children') and item.children:
-                for child_list in item.children:
-                    nested_flowables = self._convert_list(child_list, styles, base_indent + 30)
-                    if nested_flowables:
-                        if isinstance(nested_flowables, list):
-                            flowables.extend(nested_flowables)
-                        else:
-                            flowables.append(nested_flowables)
-
-        return flowables
+        return [flowables_by_list[id(list_element)]]
 
     def _convert_code_block(self, code_block, styles):
         """Convert a code block element to PDF."""
-        # Create a custom style for code blocks with Unicode-capable monospace font
-        code_style = ParagraphStyle(
-            'CodeBlock',
-            parent=styles['Code'],
-            fontName=self._unicode_font_name or 'Courier',
-            fontSize=9,
-            leftIndent=20,
-            rightIndent=20,
-            spaceBefore=6,
-            spaceAfter=6,
-            backColor='#f5f5f5'
-        )
-
         # Use Preformatted to preserve whitespace and formatting
-        return Preformatted(code_block.content, code_style)
+        return Preformatted(code_block.content, self._get_code_style(styles))
+
+    def _get_code_style(self, styles):
+        """
+        Get the code block style for a style sheet.
+
+        Code blocks in a document share one style sheet, so the derived
+        style is built once and reused until a different sheet is passed.
+
+        Args:
+            styles: ReportLab style sheet
+
+        Returns:
+            ParagraphStyle: Code block style with a Unicode-capable monospace font
+        """
+        if styles is not self._code_style_sheet:
+            self._code_style = ParagraphStyle(
+                'CodeBlock',
+                parent=styles['Code'],
+                fontName=self._unicode_font_name or 'Courier',
+                fontSize=9,
+                leftIndent=20,
+                rightIndent=20,
+                spaceBefore=6,
+                spaceAfter=6,
+                backColor='#f5f5f5'
+            )
+            self._code_style_sheet = styles
+        return self._code_style
+
+    def _get_heading_styles(self, styles):
+        """
+        Get the heading styles of a style sheet, in level order.
+
+        Args:
+            styles: ReportLab style sheet
+
+        Returns:
+            tuple: Heading1 to Heading6 styles
+        """
+        if styles is not self._heading_style_sheet:
+            self._heading_styles = tuple(styles[name] for name in _HEADING_STYLE_NAMES)
+            self._heading_style_sheet = styles
+        return self._heading_styles
 
     def supports_format(self, file_path: Union[str, Path]) -> bool:
         """Check if this writer supports the given file format."""
-        return Path(file_path).suffix.lower() == '.pdf'
+        return file_extension(file_path) in self._EXTENSIONS
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
         """Get list of supported file extensions."""
-        return ['.pdf']
+        return list(cls._SUPPORTED_EXTENSIONS)
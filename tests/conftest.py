@@ -3,24 +3,57 @@ Pytest configuration and shared fixtures.
 """
 
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
+from src.core.converter import ConverterFactory
 from src.core.document import Document
+from src.readers.markdown_reader import MarkdownReader
+from src.writers.markdown_writer import MarkdownWriter
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
+@pytest.fixture(autouse=True)
+def isolate_converter_factory():
+    """Restore the ConverterFactory registries and caches after each test."""
+    state = [
+        (registry, dict(registry))
+        for registry in (ConverterFactory._readers, ConverterFactory._writers,
+                         ConverterFactory._pair_cache, ConverterFactory._instances)
+    ]
+    yield
+    # Restore in place so the class attributes keep their identity
+    for registry, snapshot in state:
+        registry.clear()
+        registry.update(snapshot)
+
+
+@pytest.fixture(scope='session')
+def docx_writer():
+    """DOCX writer shared by the whole session; writers keep no per-call state."""
+    # python-docx is imported only by sessions that run DOCX tests
+    from src.writers.docx_writer import DocxWriter
+    return DocxWriter()
+
+
+@pytest.fixture(scope='session')
+def markdown_reader():
+    """Markdown reader shared by the whole session."""
+    return MarkdownReader()
+
+
+@pytest.fixture(scope='session')
+def markdown_writer():
+    """Markdown writer shared by the whole session."""
+    return MarkdownWriter()
 
 
 @pytest.fixture
+def temp_dir(tmp_path):
+    """Temporary directory for test files, managed by pytest's tmp_path."""
+    return tmp_path
+
+
+@pytest.fixture(scope='session')
 def sample_document():
-    """Create a sample document for testing."""
+    """Create a sample document for testing; shared, so tests must not modify it."""
     doc = Document(title="Test Document")
     doc.add_heading("Chapter 1", level=1)
     doc.add_paragraph("This is a paragraph with some text.")
@@ -33,7 +66,7 @@ def sample_document():
     return doc
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_markdown_content():
     """Sample markdown content for testing."""
     return """# Test Document
@@ -60,12 +93,12 @@ Final paragraph.
 """
 
 
-@pytest.fixture
-def sample_markdown_file(temp_dir, sample_markdown_content):
-    """Create a sample markdown file for testing."""
-    markdown_file = temp_dir / "sample.md"
+@pytest.fixture(scope='session')
+def parsed_sample(tmp_path_factory, sample_markdown_content, markdown_reader):
+    """Sample markdown read from disk once per session; tests must not modify it."""
+    markdown_file = tmp_path_factory.mktemp("markdown") / "sample.md"
     markdown_file.write_text(sample_markdown_content, encoding='utf-8')
-    return markdown_file
+    return markdown_reader.read(markdown_file)
 
 
 @pytest.fixture
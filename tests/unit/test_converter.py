@@ -2,6 +2,7 @@
 Unit tests for converter factory and document converter.
 """
 
+import os
 import pytest
 from unittest.mock import Mock, patch
 from pathlib import Path
@@ -21,7 +22,7 @@ class MockReader(BaseReader):
         return doc
 
     def supports_format(self, file_path):
-        return Path(file_path).suffix.lower() == '.mock'
+        return os.fspath(file_path).lower().endswith('.mock')
 
     @classmethod
     def get_supported_extensions(cls):
@@ -38,7 +39,7 @@ class MockWriter(BaseWriter):
         return "Mock string representation"
 
     def supports_format(self, file_path):
-        return Path(file_path).suffix.lower() == '.mock'
+        return os.fspath(file_path).lower().endswith('.mock')
 
     @classmethod
     def get_supported_extensions(cls):
@@ -48,12 +49,6 @@ class MockWriter(BaseWriter):
 class TestConverterFactory:
     """Test ConverterFactory functionality."""
 
-    def setup_method(self):
-        """Set up test environment."""
-        # Clear any existing registrations
-        ConverterFactory._readers.clear()
-        ConverterFactory._writers.clear()
-
     def test_register_reader(self):
         """Test registering a reader."""
         ConverterFactory.register_reader(MockReader)
@@ -75,6 +70,33 @@ class TestConverterFactory:
         reader = ConverterFactory.get_reader("test.mock")
         assert isinstance(reader, MockReader)
 
+    def test_lazy_registration(self):
+        """Test that lazily registered classes are imported on first use."""
+        ConverterFactory.register_reader_lazy(['.MOCK'], 'tests.unit.test_converter:MockReader')
+        ConverterFactory.register_writer_lazy(['.mock'], 'tests.unit.test_converter:MockWriter')
+
+        assert ConverterFactory._readers['.mock'] == 'tests.unit.test_converter:MockReader'
+        assert isinstance(ConverterFactory.get_reader("test.mock"), MockReader)
+        assert isinstance(ConverterFactory.get_writer("test.mock"), MockWriter)
+        assert ConverterFactory._readers['.mock'] is MockReader
+
+    def test_package_registrations_match_classes(self):
+        """Test that the package's lazy registrations match each class."""
+        import src
+
+        for name, (_, extensions) in {**src._READERS, **src._WRITERS}.items():
+            assert list(extensions) == getattr(src, name).get_supported_extensions()
+
+    def test_supports_input_and_output(self):
+        """Test extension checks against the registries."""
+        ConverterFactory.register_reader(MockReader)
+        ConverterFactory.register_writer(MockWriter)
+
+        assert ConverterFactory.supports_input('.MOCK') is True
+        assert ConverterFactory.supports_input('.unknown') is False
+        assert ConverterFactory.supports_output('.mock') is True
+        assert ConverterFactory.supports_output('.unknown') is False
+
     def test_get_reader_not_registered(self):
         """Test getting a reader that's not registered."""
         with pytest.raises(ValueError, match="No reader registered for extension"):
@@ -101,6 +123,50 @@ class TestConverterFactory:
         assert isinstance(converter, DocumentConverter)
         assert isinstance(converter.reader, MockReader)
         assert isinstance(converter.writer, MockWriter)
+        assert converter.formats_validated is True
+
+    def test_create_converter_caches_class_pair(self):
+        """Test that resolved classes are cached until a registration changes."""
+        ConverterFactory.register_reader(MockReader)
+        ConverterFactory.register_writer(MockWriter)
+
+        ConverterFactory.create_converter("a.mock", "b.MOCK")
+        ConverterFactory.create_converter("c.mock", "d.mock")
+        assert ConverterFactory._pair_cache[('.mock', '.mock')] == (MockReader, MockWriter)
+
+        class OtherReader(MockReader):
+            pass
+
+        ConverterFactory._readers['.mock'] = OtherReader
+        ConverterFactory.register_writer(MockWriter)
+        assert isinstance(ConverterFactory.create_converter("a.mock", "b.mock").reader, OtherReader)
+
+    def test_stateless_instances_are_shared(self):
+        """Test that stateless classes are instantiated once and stateful ones per call."""
+        class StatelessReader(MockReader):
+            stateless = True
+
+        ConverterFactory.register_reader(StatelessReader)
+        ConverterFactory.register_writer(MockWriter)
+
+        first = ConverterFactory.create_converter("a.mock", "b.mock")
+        second = ConverterFactory.create_converter("c.mock", "d.mock")
+
+        assert first.reader is second.reader
+        assert first.reader is ConverterFactory.get_reader("e.mock")
+        assert isinstance(first.writer, MockWriter)
+        assert first.writer is not second.writer
+
+    def test_components_are_stateful_by_default(self):
+        """Test that subclasses must opt in to instance sharing."""
+        assert BaseReader.stateless is False
+        assert BaseWriter.stateless is False
+        assert MockReader.stateless is False
+
+        from src.readers.markdown_reader import MarkdownReader
+        from src.writers.markdown_writer import MarkdownWriter
+        assert MarkdownReader.stateless is True
+        assert MarkdownWriter.stateless is True
 
     def test_create_converter_no_reader(self):
         """Test creating converter when reader is not available."""
@@ -155,6 +221,14 @@ class TestConverterFactory:
         assert ConverterFactory.is_conversion_supported('.mock', '.MOCK') is True
 
 
+@pytest.fixture
+def input_file(temp_dir):
+    """An existing input file for converter tests."""
+    path = temp_dir / "input.txt"
+    path.write_text("test content")
+    return path
+
+
 class TestDocumentConverter:
     """Test DocumentConverter functionality."""
 
@@ -169,11 +243,8 @@ class TestDocumentConverter:
         assert self.converter.reader == self.mock_reader
         assert self.converter.writer == self.mock_writer
 
-    def test_convert_success(self, temp_dir):
+    def test_convert_success(self, temp_dir, input_file):
         """Test successful conversion."""
-        # Create input file
-        input_file = temp_dir / "input.txt"
-        input_file.write_text("test content")
         output_file = temp_dir / "output.txt"
 
         # Set up mocks
@@ -199,10 +270,8 @@ class TestDocumentConverter:
         with pytest.raises(FileNotFoundError, match="Input file not found"):
             self.converter.convert(input_file, output_file)
 
-    def test_convert_reader_format_not_supported(self, temp_dir):
+    def test_convert_reader_format_not_supported(self, temp_dir, input_file):
         """Test conversion when reader doesn't support input format."""
-        input_file = temp_dir / "input.txt"
-        input_file.write_text("test content")
         output_file = temp_dir / "output.txt"
 
         self.mock_reader.supports_format.return_value = False
@@ -210,10 +279,8 @@ class TestDocumentConverter:
         with pytest.raises(ValueError, match="Reader does not support format"):
             self.converter.convert(input_file, output_file)
 
-    def test_convert_writer_format_not_supported(self, temp_dir):
+    def test_convert_writer_format_not_supported(self, temp_dir, input_file):
         """Test conversion when writer doesn't support output format."""
-        input_file = temp_dir / "input.txt"
-        input_file.write_text("test content")
         output_file = temp_dir / "output.txt"
 
         self.mock_reader.supports_format.return_value = True
@@ -222,11 +289,8 @@ class TestDocumentConverter:
         with pytest.raises(ValueError, match="Writer does not support format"):
             self.converter.convert(input_file, output_file)
 
-    def test_convert_to_string_success(self, temp_dir):
+    def test_convert_to_string_success(self, input_file):
         """Test successful conversion to string."""
-        input_file = temp_dir / "input.txt"
-        input_file.write_text("test content")
-
         mock_document = Mock(spec=Document)
         self.mock_reader.supports_format.return_value = True
         self.mock_reader.read.return_value = mock_document
@@ -245,20 +309,15 @@ class TestDocumentConverter:
         with pytest.raises(FileNotFoundError, match="Input file not found"):
             self.converter.convert_to_string(input_file)
 
-    def test_convert_to_string_format_not_supported(self, temp_dir):
+    def test_convert_to_string_format_not_supported(self, input_file):
         """Test convert_to_string when format is not supported."""
-        input_file = temp_dir / "input.txt"
-        input_file.write_text("test content")
-
         self.mock_reader.supports_format.return_value = False
 
         with pytest.raises(ValueError, match="Reader does not support format"):
             self.converter.convert_to_string(input_file)
 
-    def test_convert_with_string_paths(self, temp_dir):
+    def test_convert_with_string_paths(self, temp_dir, input_file):
         """Test conversion with string paths instead of Path objects."""
-        input_file = temp_dir / "input.txt"
-        input_file.write_text("test content")
         output_file = temp_dir / "output.txt"
 
         mock_document = Mock(spec=Document)
@@ -273,14 +332,24 @@ class TestDocumentConverter:
         self.mock_reader.read.assert_called_once()
         self.mock_writer.write.assert_called_once()
 
+    def test_convert_skips_format_checks_when_validated(self, temp_dir, input_file):
+        """Test that validated converters don't re-check formats."""
+        output_file = temp_dir / "output.txt"
+
+        converter = DocumentConverter(self.mock_reader, self.mock_writer,
+                                      formats_validated=True)
+        converter.convert(input_file, output_file)
+
+        self.mock_reader.supports_format.assert_not_called()
+        self.mock_writer.supports_format.assert_not_called()
+        self.mock_reader.read.assert_called_once_with(input_file)
+
 
 class TestIntegratedConverter:
     """Test converter with real components integration."""
 
     def setup_method(self):
         """Set up with real reader and writer instances."""
-        ConverterFactory._readers.clear()
-        ConverterFactory._writers.clear()
         ConverterFactory.register_reader(MockReader)
         ConverterFactory.register_writer(MockWriter)
 
@@ -304,4 +373,4 @@ class TestIntegratedConverter:
         converter = ConverterFactory.create_converter(input_file, "output.mock")
         result = converter.convert_to_string(input_file)
 
-        assert result == "Mock string representation"
\ No newline at end of file
+        assert result == "Mock string representation"
@@ -101,6 +101,59 @@ class TestDocumentElements:
         assert image.attributes["alt_text"] == "Alternative text"
         assert image.attributes["title"] == "Image title"
 
+    def test_attribute_free_elements_share_empty_attributes(self):
+        """Test that elements without attributes don't allocate a dict."""
+        first = Paragraph(content="One")
+        second = Paragraph(content="Two")
+
+        assert first.attributes == {}
+        assert first.attributes is second.attributes
+        with pytest.raises(TypeError):
+            first.attributes["key"] = "value"
+
+        heading = Heading(content="Heading", level=3)
+        assert heading.attributes is not first.attributes
+        assert first.attributes == {}
+
+    def test_documents_with_attribute_free_elements_copy_and_pickle(self):
+        """Test that shared empty attributes survive deepcopy and pickling."""
+        import copy
+        import pickle
+
+        doc = Document(title="Doc")
+        doc.add_paragraph("Paragraph")
+        doc.add_heading("Heading", level=2)
+
+        for clone in (copy.deepcopy(doc), pickle.loads(pickle.dumps(doc))):
+            paragraph, heading = clone.elements
+            assert paragraph.content == "Paragraph"
+            assert paragraph.attributes == {}
+            assert heading.attributes == {"level": 2}
+            assert len(clone.get_elements_by_type(ElementType.PARAGRAPH)) == 1
+
+            # Copies own a plain dict, independent of the shared mapping
+            paragraph.attributes["id"] = "intro"
+            assert doc.elements[0].attributes == {}
+
+    def test_explicit_attributes_are_kept(self):
+        """Test that caller-provided attributes are extended, not replaced."""
+        heading = Heading(content="Heading", attributes={"id": "intro"}, level=2)
+        assert heading.attributes == {"id": "intro", "level": 2}
+
+    def test_element_type_identity_hash(self):
+        """Test that element types hash by identity and stay usable as keys."""
+        handlers = {element_type: element_type.value for element_type in ElementType}
+
+        assert hash(ElementType.HEADING) == object.__hash__(ElementType.HEADING)
+        assert handlers[ElementType("heading")] == "heading"
+
+    def test_elements_use_slots(self):
+        """Test that elements and documents are slotted and carry no instance dict."""
+        for element in (Heading(content="H"), Paragraph(content="P"),
+                        DocumentList(), ListItem(), CodeBlock(), Link(), Image(),
+                        Document()):
+            assert not hasattr(element, "__dict__")
+
 
 class TestDocument:
     """Test Document class functionality."""
@@ -126,24 +179,23 @@ class TestDocument:
         assert len(doc.elements) == 1
         assert doc.elements[0] == heading
 
-    def test_add_heading(self):
-        """Test add_heading convenience method."""
-        doc = Document()
-        heading = doc.add_heading("Test Heading", level=2)
-        assert len(doc.elements) == 1
-        assert isinstance(heading, Heading)
-        assert heading.content == "Test Heading"
-        assert heading.level == 2
-        assert doc.elements[0] == heading
-
-    def test_add_paragraph(self):
-        """Test add_paragraph convenience method."""
+    @pytest.mark.parametrize("method,args,kwargs,element_class,expected_attrs", [
+        ("add_heading", ("Test Heading",), {"level": 2}, Heading,
+         {"content": "Test Heading", "level": 2}),
+        ("add_paragraph", ("Test paragraph",), {}, Paragraph,
+         {"content": "Test paragraph"}),
+        ("add_code_block", ("print('hello')",), {"language": "python"}, CodeBlock,
+         {"content": "print('hello')", "language": "python"}),
+    ])
+    def test_add_element_helpers(self, method, args, kwargs, element_class, expected_attrs):
+        """Test the add_heading, add_paragraph and add_code_block convenience methods."""
         doc = Document()
-        paragraph = doc.add_paragraph("Test paragraph")
+        element = getattr(doc, method)(*args, **kwargs)
         assert len(doc.elements) == 1
-        assert isinstance(paragraph, Paragraph)
-        assert paragraph.content == "Test paragraph"
-        assert doc.elements[0] == paragraph
+        assert isinstance(element, element_class)
+        for name, value in expected_attrs.items():
+            assert getattr(element, name) == value
+        assert doc.elements[0] == element
 
     def test_add_list(self):
         """Test add_list convenience method."""
@@ -156,15 +208,6 @@ class TestDocument:
         assert list_element.items[0].content == "Item 1"
         assert list_element.items[1].content == "Item 2"
 
-    def test_add_code_block(self):
-        """Test add_code_block convenience method."""
-        doc = Document()
-        code_block = doc.add_code_block("print('hello')", language="python")
-        assert len(doc.elements) == 1
-        assert isinstance(code_block, CodeBlock)
-        assert code_block.content == "print('hello')"
-        assert code_block.language == "python"
-
     def test_get_elements_by_type(self):
         """Test getting elements by type."""
         doc = Document()
@@ -181,6 +224,47 @@ class TestDocument:
         assert all(h.element_type == ElementType.HEADING for h in headings)
         assert all(p.element_type == ElementType.PARAGRAPH for p in paragraphs)
 
+    def test_get_elements_by_type_returns_copy(self):
+        """Test that callers cannot modify the document's type index."""
+        doc = Document()
+        doc.add_paragraph("Paragraph")
+
+        doc.get_elements_by_type(ElementType.PARAGRAPH).clear()
+
+        assert len(doc.get_elements_by_type(ElementType.PARAGRAPH)) == 1
+        assert doc.get_elements_by_type(ElementType.IMAGE) == []
+
+    def test_elements_list_stays_mutable(self):
+        """Test that elements is a plain list callers can still change."""
+        doc = Document()
+        assert doc.elements == []
+
+        paragraph = Paragraph(content="Appended")
+        doc.elements.append(paragraph)
+        doc.elements.insert(0, Heading(content="Inserted"))
+
+        assert len(doc) == 2
+        assert doc.get_elements_by_type(ElementType.PARAGRAPH) == [paragraph]
+        assert [h.content for h in doc.get_headings()] == ["Inserted"]
+
+        doc.elements.remove(paragraph)
+        assert doc.get_elements_by_type(ElementType.PARAGRAPH) == []
+
+    def test_assigning_elements_rebuilds_index(self):
+        """Test that replacing the elements keeps type lookups in step."""
+        doc = Document()
+        doc.add_heading("Old heading")
+        paragraph = Paragraph(content="New")
+
+        doc.elements = [paragraph]
+
+        assert doc.elements == [paragraph]
+        assert doc.get_elements_by_type(ElementType.PARAGRAPH) == [paragraph]
+        assert doc.get_headings() == []
+
+        doc.add_paragraph("Added")
+        assert len(doc.get_elements_by_type(ElementType.PARAGRAPH)) == 2
+
     def test_get_headings(self):
         """Test get_headings convenience method."""
         doc = Document()
@@ -3,66 +3,135 @@ Unit tests for DOCX writer.
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
+pytest.importorskip("docx")
+
 from src.writers.docx_writer import DocxWriter
-from src.core.document import Document, ElementType
+from src.core.document import Document, DocumentElement, ElementType
+
+
+class MockHeading:
+    """Heading stand-in carrying only what _add_heading_to_docx reads."""
+
+    def __init__(self, level):
+        self.attributes = {"level": level}
+        self.content = "Test"
+
+
+class UnknownElement(DocumentElement):
+    """Element whose type no writer handler knows."""
+
+    def __post_init__(self):
+        self.element_type = "unknown_type"
+        self.content = "Unknown content"
+
+
+class MockDocumentList:
+    """List stand-in with no items."""
+
+    def __init__(self):
+        self.element_type = ElementType.LIST
+        self.attributes = {"ordered": False}
+        self.items = []
+
+
+class CallRecorder:
+    """Callable that records its calls and returns a fixed value."""
+
+    def __init__(self, return_value=None):
+        self.calls = []
+        self.return_value = return_value
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+
+def paragraph_stub():
+    """Paragraph stand-in whose runs and formats accept any attribute."""
+    run = SimpleNamespace(font=SimpleNamespace())
+    return SimpleNamespace(paragraph_format=SimpleNamespace(), add_run=CallRecorder(run))
+
+
+@pytest.fixture
+def mock_docx_class(monkeypatch):
+    """Replace python-docx's Document class in the DOCX writer module."""
+    mock_class = MagicMock()
+    monkeypatch.setattr('src.writers.docx_writer.DocxDocument', mock_class)
+    return mock_class
+
+
+@pytest.fixture(scope="module")
+def list_documents():
+    """Documents with an unordered list, and with an unordered then an ordered list.
+
+    Shared by the module's list tests, which must not modify them.
+    """
+    unordered_doc = Document()
+    unordered_doc.add_list(["Item 1", "Item 2"], ordered=False)
+
+    mixed_doc = Document()
+    mixed_doc.add_list(["Item 1"], ordered=False)
+    mixed_doc.add_list(["Item 1"], ordered=True)
+
+    return unordered_doc, mixed_doc
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_inches():
+    """Make Inches an identity so lengths handed to stubs stay plain numbers."""
+    with patch('src.writers.docx_writer.Inches', lambda x: x):
+        yield
 
 
 class TestDocxWriter:
     """Test DocxWriter functionality."""
 
-    def test_supports_format_docx(self):
+    def test_supports_format_docx(self, docx_writer):
         """Test that DOCX writer supports .docx files."""
-        writer = DocxWriter()
-        assert writer.supports_format("test.docx") is True
-        assert writer.supports_format("test.DOCX") is True
+        assert docx_writer.supports_format("test.docx") is True
+        assert docx_writer.supports_format("test.DOCX") is True
 
-    def test_supports_format_non_docx(self):
+    def test_supports_format_non_docx(self, docx_writer):
         """Test that DOCX writer doesn't support non-DOCX files."""
-        writer = DocxWriter()
-        assert writer.supports_format("test.md") is False
-        assert writer.supports_format("test.pdf") is False
-        assert writer.supports_format("test.txt") is False
+        assert docx_writer.supports_format("test.md") is False
+        assert docx_writer.supports_format("test.pdf") is False
+        assert docx_writer.supports_format("test.txt") is False
 
     def test_get_supported_extensions(self):
         """Test getting supported extensions."""
         extensions = DocxWriter.get_supported_extensions()
         assert extensions == ['.docx']
 
-    def test_to_string_document_summary(self, sample_document):
+    def test_to_string_document_summary(self, sample_document, docx_writer):
         """Test to_string returns document summary."""
-        writer = DocxWriter()
-        summary = writer.to_string(sample_document)
+        summary = docx_writer.to_string(sample_document)
 
         assert "Title: Test Document" in summary
         assert "Elements:" in summary
         assert "heading:" in summary.lower()
         assert "paragraph:" in summary.lower()
 
-    def test_to_string_invalid_input(self):
+    def test_to_string_invalid_input(self, docx_writer):
         """Test to_string with invalid input."""
-        writer = DocxWriter()
-
         with pytest.raises(ValueError, match="Input must be a Document object"):
-            writer.to_string("not a document")
+            docx_writer.to_string("not a document")
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    def test_create_docx_document_with_title(self, mock_docx_class, sample_document):
+    def test_create_docx_document_with_title(self, mock_docx_class, sample_document, docx_writer):
         """Test creating DOCX document with title."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
 
-        writer = DocxWriter()
-        result = writer._create_docx_document(sample_document)
+        result = docx_writer._create_docx_document(sample_document)
 
         assert result == mock_docx_doc
         # Verify title was added
         mock_docx_doc.add_heading.assert_called()
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    def test_create_docx_document_without_title(self, mock_docx_class):
+    def test_create_docx_document_without_title(self, mock_docx_class, docx_writer):
         """Test creating DOCX document without title."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
@@ -70,13 +139,11 @@ class TestDocxWriter:
         document = Document()  # No title
         document.add_paragraph("Test paragraph")
 
-        writer = DocxWriter()
-        result = writer._create_docx_document(document)
+        result = docx_writer._create_docx_document(document)
 
         assert result == mock_docx_doc
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    def test_add_heading_to_docx(self, mock_docx_class):
+    def test_add_heading_to_docx(self, mock_docx_class, docx_writer):
         """Test adding heading elements to DOCX."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
@@ -84,14 +151,12 @@ class TestDocxWriter:
         document = Document()
         document.add_heading("Test Heading", level=2)
 
-        writer = DocxWriter()
-        writer._create_docx_document(document)
+        docx_writer._create_docx_document(document)
 
         # Should call add_heading for both title and content heading
         mock_docx_doc.add_heading.assert_called()
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    def test_add_paragraph_to_docx(self, mock_docx_class):
+    def test_add_paragraph_to_docx(self, mock_docx_class, docx_writer):
         """Test adding paragraph elements to DOCX."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
@@ -99,196 +164,154 @@ class TestDocxWriter:
         document = Document()
         document.add_paragraph("Test paragraph content")
 
-        writer = DocxWriter()
-        writer._create_docx_document(document)
+        docx_writer._create_docx_document(document)
 
         mock_docx_doc.add_paragraph.assert_called_with("Test paragraph content")
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    @patch('src.writers.docx_writer.Inches')
-    def test_add_list_to_docx(self, mock_inches, mock_docx_class):
+    def test_add_list_to_docx(self, mock_docx_class, docx_writer, list_documents):
         """Test adding list elements to DOCX."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
 
-        mock_para = Mock()
-        mock_docx_doc.add_paragraph.return_value = mock_para
-
-        document = Document()
-        document.add_list(["Item 1", "Item 2"], ordered=False)
+        mock_docx_doc.add_paragraph.return_value = paragraph_stub()
 
-        writer = DocxWriter()
-        writer._create_docx_document(document)
+        unordered_doc, _ = list_documents
+        docx_writer._create_docx_document(unordered_doc)
 
         # Should add paragraphs for list items
         assert mock_docx_doc.add_paragraph.call_count >= 2
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    def test_add_code_block_to_docx(self, mock_docx_class):
+    def test_add_code_block_to_docx(self, mock_docx_class, docx_writer):
         """Test adding code block elements to DOCX."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
 
-        mock_para = Mock()
-        mock_run = Mock()
-        mock_para.add_run.return_value = mock_run
+        mock_para = paragraph_stub()
         mock_docx_doc.add_paragraph.return_value = mock_para
 
         document = Document()
         document.add_code_block("print('hello')", language="python")
 
-        writer = DocxWriter()
-        writer._create_docx_document(document)
+        docx_writer._create_docx_document(document)
 
         mock_docx_doc.add_paragraph.assert_called()
-        mock_para.add_run.assert_called_with("print('hello')")
-
-    def test_heading_level_limits(self):
+        assert mock_para.add_run.calls[-1] == (("print('hello')",), {})
+
+    @pytest.mark.parametrize("level,expected_level", [
+        (15, 9),  # Beyond Word's limit
+        (0, 1),   # Too low
+        (3, 3),   # Normal level
+    ])
+    def test_heading_level_limits(self, docx_writer, level, expected_level):
         """Test that heading levels are limited to valid Word range."""
-        writer = DocxWriter()
-
-        # Test with mock heading elements
-        class MockHeading:
-            def __init__(self, level):
-                self.attributes = {"level": level}
-                self.content = "Test"
-
         mock_docx_doc = Mock()
 
-        # Test level too high
-        heading = MockHeading(15)  # Beyond Word's limit
-        writer._add_heading_to_docx(heading, mock_docx_doc)
-        mock_docx_doc.add_heading.assert_called_with("Test", level=9)
-
-        # Test level too low
-        heading = MockHeading(0)
-        writer._add_heading_to_docx(heading, mock_docx_doc)
-        mock_docx_doc.add_heading.assert_called_with("Test", level=1)
+        docx_writer._add_heading_to_docx(MockHeading(level), mock_docx_doc)
+        mock_docx_doc.add_heading.assert_called_with("Test", level=expected_level)
 
-        # Test normal level
-        heading = MockHeading(3)
-        writer._add_heading_to_docx(heading, mock_docx_doc)
-        mock_docx_doc.add_heading.assert_called_with("Test", level=3)
-
-    @patch('src.writers.docx_writer.DocxDocument')
-    def test_write_to_file(self, mock_docx_class, sample_document, temp_dir):
+    def test_write_to_file(self, mock_docx_class, sample_document, temp_dir, docx_writer):
         """Test writing document to file."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
 
-        writer = DocxWriter()
         output_file = temp_dir / "output.docx"
 
-        writer.write(sample_document, output_file)
+        docx_writer.write(sample_document, output_file)
 
         mock_docx_doc.save.assert_called_once_with(output_file)
 
-    def test_write_unsupported_format(self, sample_document, temp_dir):
+    def test_write_unsupported_format(self, sample_document, temp_dir, docx_writer):
         """Test writing to unsupported format."""
-        writer = DocxWriter()
         output_file = temp_dir / "output.md"
 
         with pytest.raises(ValueError, match="Unsupported output format"):
-            writer.write(sample_document, output_file)
+            docx_writer.write(sample_document, output_file)
+
+    def test_write_double_sided_footer(self, sample_document, temp_dir, docx_writer,
+                                       monkeypatch):
+        """Test that odd and even page footers are written."""
+        from docx import Document as DocxDocument
+        from docx.shared import Inches
+        from src.core.footer import FooterConfig
+
+        # This test saves a real document, so it needs real lengths
+        monkeypatch.setattr('src.writers.docx_writer.Inches', Inches)
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    def test_write_io_error(self, mock_docx_class, sample_document, temp_dir):
+        output_file = temp_dir / "output.docx"
+        footer_config = FooterConfig(layout="double", left_template="Left",
+                                     right_template="Page {page}")
+
+        docx_writer.write(sample_document, output_file, footer_config)
+
+        section = DocxDocument(str(output_file)).sections[0]
+        assert [p.text for p in section.footer.paragraphs] == ["Left\tPage 1"]
+        assert [p.text for p in section.even_page_footer.paragraphs] == ["Page 2\tLeft"]
+
+    def test_write_io_error(self, mock_docx_class, sample_document, temp_dir, docx_writer):
         """Test handling IO errors during write."""
         mock_docx_doc = Mock()
         mock_docx_doc.save.side_effect = IOError("Write failed")
         mock_docx_class.return_value = mock_docx_doc
 
-        writer = DocxWriter()
         output_file = temp_dir / "output.docx"
 
         with pytest.raises(IOError, match="Error writing to file"):
-            writer.write(sample_document, output_file)
+            docx_writer.write(sample_document, output_file)
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    def test_empty_document(self, mock_docx_class):
+    def test_empty_document(self, mock_docx_class, docx_writer):
         """Test handling empty document."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
 
         document = Document()  # Empty document
 
-        writer = DocxWriter()
-        result = writer._create_docx_document(document)
+        result = docx_writer._create_docx_document(document)
 
         assert result == mock_docx_doc
         # Should not crash with empty document
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    def test_unknown_element_type(self, mock_docx_class):
+    def test_unknown_element_type(self, mock_docx_class, docx_writer):
         """Test handling unknown element types."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
 
-        # Create a custom element with unknown type
-        from src.core.document import DocumentElement, ElementType
-
-        class UnknownElement(DocumentElement):
-            def __post_init__(self):
-                self.element_type = "unknown_type"
-                self.content = "Unknown content"
-
         document = Document()
         unknown_element = UnknownElement()
         document.add_element(unknown_element)
 
-        writer = DocxWriter()
-        writer._create_docx_document(document)
+        docx_writer._create_docx_document(document)
 
         # Should fall back to adding as paragraph
         mock_docx_doc.add_paragraph.assert_called_with("Unknown content")
 
-    def test_list_without_items(self):
+    def test_list_without_items(self, docx_writer):
         """Test handling list elements without items."""
-        writer = DocxWriter()
-
-        # Create a mock list element without items
-        class MockDocumentList:
-            def __init__(self):
-                self.element_type = ElementType.LIST
-                self.attributes = {"ordered": False}
-
         mock_docx_doc = Mock()
         mock_list = MockDocumentList()
 
         # Should not crash when list has no items
-        writer._add_list_to_docx(mock_list, mock_docx_doc)
+        docx_writer._add_list_to_docx(mock_list, mock_docx_doc)
 
         # Should not call add_paragraph for empty list
         mock_docx_doc.add_paragraph.assert_not_called()
 
-    @patch('src.writers.docx_writer.DocxDocument')
-    @patch('src.writers.docx_writer.Inches')
-    def test_ordered_vs_unordered_lists(self, mock_inches, mock_docx_class):
+    def test_ordered_vs_unordered_lists(self, mock_docx_class, docx_writer,
+                                        list_documents):
         """Test different bullet styles for ordered vs unordered lists."""
         mock_docx_doc = Mock()
         mock_docx_class.return_value = mock_docx_doc
 
-        mock_para = Mock()
-        mock_run = Mock()
-        mock_para.add_run.return_value = mock_run
+        mock_para = paragraph_stub()
         mock_docx_doc.add_paragraph.return_value = mock_para
 
-        document = Document()
-
-        # Add unordered list
-        document.add_list(["Item 1"], ordered=False)
-
-        # Add ordered list
-        document.add_list(["Item 1"], ordered=True)
-
-        writer = DocxWriter()
-        writer._create_docx_document(document)
+        _, mixed_doc = list_documents
+        docx_writer._create_docx_document(mixed_doc)
 
         # Should have called add_run with different bullet styles
-        calls = mock_para.add_run.call_args_list
+        calls = mock_para.add_run.calls
         assert len(calls) >= 2
 
         # Check that different bullet styles were used
-        bullet_calls = [call[0][0] for call in calls]
+        bullet_calls = [args[0] for args, _ in calls]
         assert any("•" in call for call in bullet_calls)  # Unordered
         assert any("1." in call for call in bullet_calls)  # Ordered
\ No newline at end of file
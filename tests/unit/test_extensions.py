@@ -0,0 +1,29 @@
+"""
+Unit tests for file extension lookup.
+"""
+
+from pathlib import Path
+
+from src.core.extensions import file_extension
+
+
+class TestFileExtension:
+    """Test file_extension functionality."""
+
+    def test_lower_cases_extension(self):
+        """Test that extensions are returned lower-cased."""
+        assert file_extension("notes.MD") == ".md"
+        assert file_extension("dir/report.Pdf") == ".pdf"
+
+    def test_accepts_paths(self):
+        """Test that Path objects give the same result as strings."""
+        assert file_extension(Path("dir") / "doc.docx") == ".docx"
+
+    def test_no_extension(self):
+        """Test files without an extension."""
+        assert file_extension("README") == ""
+        assert file_extension(".hidden") == ""
+
+    def test_only_last_extension(self):
+        """Test that only the final suffix is used."""
+        assert file_extension("archive.tar.gz") == ".gz"
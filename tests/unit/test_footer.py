@@ -0,0 +1,153 @@
+"""
+Unit tests for footer configuration.
+"""
+
+import pytest
+from datetime import date
+from unittest.mock import patch
+
+from src.core.footer import FooterConfig
+
+
+class TestFooterConfig:
+    """Test FooterConfig functionality."""
+
+    def test_invalid_layout(self):
+        """Test that an unknown layout is rejected."""
+        with pytest.raises(ValueError, match="Invalid layout"):
+            FooterConfig(layout="triple")
+
+    def test_date_string_is_cached(self):
+        """Test that the clock is only read once per configuration."""
+        config = FooterConfig(date_format="%Y")
+
+        with patch('src.core.footer.datetime') as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "2024"
+            assert config.get_date_string() == "2024"
+            assert config.get_date_string() == "2024"
+
+        mock_datetime.now.assert_called_once()
+
+    def test_date_refreshes_on_a_new_day(self):
+        """Test that a long-lived configuration picks up the current date."""
+        config = FooterConfig(left_template="Updated {date}", right_template="P{page}")
+
+        with patch('src.core.footer.date') as mock_date, \
+                patch('src.core.footer.datetime') as mock_datetime:
+            mock_date.today.return_value = date(2024, 1, 1)
+            mock_datetime.now.return_value.strftime.return_value = "2024-01-01"
+            assert config.get_footer_for_page(1) == ("Updated 2024-01-01", "P1")
+
+            mock_date.today.return_value = date(2024, 1, 2)
+            mock_datetime.now.return_value.strftime.return_value = "2024-01-02"
+            assert config.get_footer_for_page(1) == ("Updated 2024-01-02", "P1")
+            assert config.get_date_string() == "2024-01-02"
+
+    def test_page_footer_memo_is_bounded(self, monkeypatch):
+        """Test that the page memo does not grow without limit."""
+        monkeypatch.setattr('src.core.footer._PAGE_FOOTER_CACHE_SIZE', 4)
+        config = FooterConfig(left_template="L", right_template="P{page}")
+
+        for page in range(1, 11):
+            assert config.get_footer_for_page(page) == ("L", f"P{page}")
+            assert len(config._page_footers) <= 4
+
+    def test_single_layout(self):
+        """Test footer text for single-sided layout."""
+        config = FooterConfig(left_template="Left", right_template="Page {page}")
+
+        assert config.get_footer_for_page(1) == ("Left", "Page 1")
+        assert config.get_footer_for_page(2) == ("Left", "Page 2")
+
+    def test_double_layout_swaps_even_pages(self):
+        """Test that double-sided layout swaps footers on even pages."""
+        config = FooterConfig(layout="double", left_template="Left",
+                              right_template="Page {page}")
+
+        assert config.get_footer_for_page(1) == ("Left", "Page 1")
+        assert config.get_footer_for_page(2) == ("Page 2", "Left")
+
+    def test_layout_change_after_first_use(self):
+        """Test that switching to double-sided layout swaps later even pages."""
+        config = FooterConfig(left_template="L", right_template="Seite {page}")
+        assert config.get_footer_for_page(4) == ("L", "Seite 4")
+
+        config.layout = "double"
+        assert config.get_footer_for_page(4) == ("Seite 4", "L")
+
+    def test_disabled_footer(self):
+        """Test that a disabled footer produces empty text."""
+        config = FooterConfig(enabled=False)
+
+        assert config.get_footer_for_page(1) == ("", "")
+
+    def test_page_footers_are_memoized(self):
+        """Test that repeated requests for a page reuse the formatted text."""
+        config = FooterConfig()
+
+        with patch.object(config, 'format_footer_text', return_value="x") as mock_format:
+            first = config.get_footer_for_page(3)
+            second = config.get_footer_for_page(3)
+
+        assert first is second
+        assert mock_format.call_count == 2  # left and right, once
+
+    def test_page_footers_follow_setting_changes(self):
+        """Test that changing a setting after first use is not hidden by the memo."""
+        config = FooterConfig(left_template="L", right_template="P{page}")
+        assert config.get_footer_for_page(2) == ("L", "P2")
+
+        config.right_template = "Seite {page}"
+        assert config.get_footer_for_page(2) == ("L", "Seite 2")
+
+        config.enabled = False
+        assert config.get_footer_for_page(2) == ("", "")
+
+        config.enabled = True
+        assert config.get_footer_for_page(2) == ("L", "Seite 2")
+
+    def test_private_attributes_keep_page_footers(self):
+        """Test that only the text settings invalidate the memo."""
+        config = FooterConfig(left_template="L", right_template="P{page}")
+        footer = config.get_footer_for_page(1)
+
+        config.layout = "double"
+        config._unrelated = True
+
+        assert config.get_footer_for_page(1) is footer
+
+    @pytest.mark.parametrize("template", [
+        "Page {page}",
+        "Page {page} of {{total}}",
+        "{date} - {page:03d}",
+        "{page!r}|{date!s:>12}",
+        "No fields",
+        "",
+    ])
+    def test_format_footer_text_matches_str_format(self, template):
+        """Test that compiled templates render like str.format."""
+        config = FooterConfig()
+        date = config.get_date_string()
+
+        for page in (1, 2, 10):
+            expected = template.format(date=date, page=page)
+            assert config.format_footer_text(template, page) == expected
+
+    def test_date_format_change_after_first_use(self):
+        """Test that a new date format reaches cached date strings and templates."""
+        config = FooterConfig(date_format="%Y", left_template="Updated {date}")
+        year = config.get_footer_for_page(1)[0]
+
+        config.date_format = "%Y-%m"
+        left_text = config.get_footer_for_page(1)[0]
+
+        assert left_text != year
+        assert left_text.startswith(year + "-")
+        assert config.get_date_string() == left_text[len("Updated "):]
+
+    def test_format_footer_text_unknown_field(self):
+        """Test that unsupported fields still fail like str.format."""
+        config = FooterConfig()
+
+        with pytest.raises(KeyError):
+            config.format_footer_text("{title}", 1)
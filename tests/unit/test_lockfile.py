@@ -0,0 +1,50 @@
+"""
+Unit tests for lock file cleanup.
+"""
+
+import os
+
+from src.core.lockfile import (
+    get_lock_file_patterns, remove_lock_file, cleanup_lock_files
+)
+
+
+class TestLockFiles:
+    """Test lock file helpers."""
+
+    def test_get_lock_file_patterns(self, temp_dir):
+        """Test lock file candidates for a file path."""
+        patterns = get_lock_file_patterns(temp_dir / "report.docx")
+
+        assert all(isinstance(p, str) for p in patterns)
+        assert os.path.join(str(temp_dir), "~$report.docx") in patterns
+        assert os.path.join(str(temp_dir), ".~lock.report.docx#") in patterns
+        assert os.path.join(str(temp_dir), "~$report.ppwritelock") in patterns
+
+    def test_get_lock_file_patterns_bare_name(self):
+        """Test that bare file names produce relative candidates."""
+        patterns = get_lock_file_patterns("report.docx")
+
+        assert "~$report.docx" in patterns
+        assert "report.docx.lock" in patterns
+
+    def test_remove_lock_file(self, temp_dir):
+        """Test removing existing and missing lock files."""
+        lock_file = temp_dir / "~$report.docx"
+        lock_file.write_text("")
+
+        assert remove_lock_file(lock_file) is True
+        assert not lock_file.exists()
+        assert remove_lock_file(lock_file) is False
+
+    def test_cleanup_lock_files(self, temp_dir):
+        """Test that only lock files belonging to the file are removed."""
+        output_file = temp_dir / "report.docx"
+        output_file.write_text("content")
+        (temp_dir / "~$report.docx").write_text("")
+        (temp_dir / "report.docx.lock").write_text("")
+        (temp_dir / "other.docx.lock").write_text("")
+
+        assert cleanup_lock_files(output_file) == 2
+        assert output_file.exists()
+        assert (temp_dir / "other.docx.lock").exists()
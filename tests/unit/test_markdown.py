@@ -13,19 +13,17 @@ from src.core.document import Document, ElementType
 class TestMarkdownReader:
     """Test MarkdownReader functionality."""
 
-    def test_supports_format_markdown(self):
+    def test_supports_format_markdown(self, markdown_reader):
         """Test that Markdown reader supports markdown files."""
-        reader = MarkdownReader()
-        assert reader.supports_format("test.md") is True
-        assert reader.supports_format("test.markdown") is True
-        assert reader.supports_format("test.MD") is True
+        assert markdown_reader.supports_format("test.md") is True
+        assert markdown_reader.supports_format("test.markdown") is True
+        assert markdown_reader.supports_format("test.MD") is True
 
-    def test_supports_format_non_markdown(self):
+    def test_supports_format_non_markdown(self, markdown_reader):
         """Test that Markdown reader doesn't support non-markdown files."""
-        reader = MarkdownReader()
-        assert reader.supports_format("test.pdf") is False
-        assert reader.supports_format("test.docx") is False
-        assert reader.supports_format("test.txt") is False
+        assert markdown_reader.supports_format("test.pdf") is False
+        assert markdown_reader.supports_format("test.docx") is False
+        assert markdown_reader.supports_format("test.txt") is False
 
     def test_get_supported_extensions(self):
         """Test getting supported extensions."""
@@ -33,26 +31,22 @@ class TestMarkdownReader:
         assert '.md' in extensions
         assert '.markdown' in extensions
 
-    def test_read_nonexistent_file(self):
+    def test_read_nonexistent_file(self, markdown_reader):
         """Test reading a file that doesn't exist."""
-        reader = MarkdownReader()
-
         with pytest.raises(FileNotFoundError, match="Markdown file not found"):
-            reader.read("/nonexistent/file.md")
+            markdown_reader.read("/nonexistent/file.md")
 
-    def test_read_unsupported_format(self, temp_dir):
+    def test_read_unsupported_format(self, temp_dir, markdown_reader):
         """Test reading a file with unsupported format."""
-        reader = MarkdownReader()
         unsupported_file = temp_dir / "test.txt"
         unsupported_file.write_text("test content")
 
         with pytest.raises(ValueError, match="Unsupported file format"):
-            reader.read(unsupported_file)
+            markdown_reader.read(unsupported_file)
 
-    def test_read_markdown_file(self, sample_markdown_file):
+    def test_read_markdown_file(self, parsed_sample):
         """Test reading a markdown file."""
-        reader = MarkdownReader()
-        document = reader.read(sample_markdown_file)
+        document = parsed_sample
 
         assert isinstance(document, Document)
         assert document.title == "sample"
@@ -74,7 +68,7 @@ class TestMarkdownReader:
         code_blocks = document.get_elements_by_type(ElementType.CODE_BLOCK)
         assert len(code_blocks) >= 1
 
-    def test_parse_headings(self, temp_dir):
+    def test_parse_headings(self, markdown_reader):
         """Test parsing different heading levels."""
         content = """# Heading 1
 ## Heading 2
@@ -83,11 +77,7 @@ class TestMarkdownReader:
 ##### Heading 5
 ###### Heading 6
 """
-        markdown_file = temp_dir / "headings.md"
-        markdown_file.write_text(content)
-
-        reader = MarkdownReader()
-        document = reader.read(markdown_file)
+        document = markdown_reader.read_string(content)
 
         headings = document.get_elements_by_type(ElementType.HEADING)
         assert len(headings) == 6
@@ -104,7 +94,7 @@ class TestMarkdownReader:
         assert headings[0].content == "Heading 1"
         assert headings[5].content == "Heading 6"
 
-    def test_parse_code_blocks(self, temp_dir):
+    def test_parse_code_blocks(self, markdown_reader):
         """Test parsing code blocks with and without language."""
         content = """```python
 print("Hello World")
@@ -118,11 +108,7 @@ plain code block
 console.log("Hello");
 ```
 """
-        markdown_file = temp_dir / "code.md"
-        markdown_file.write_text(content)
-
-        reader = MarkdownReader()
-        document = reader.read(markdown_file)
+        document = markdown_reader.read_string(content)
 
         code_blocks = document.get_elements_by_type(ElementType.CODE_BLOCK)
         assert len(code_blocks) == 3
@@ -137,7 +123,7 @@ console.log("Hello");
         assert "plain code block" in code_blocks[1].content
         assert 'console.log("Hello");' in code_blocks[2].content
 
-    def test_parse_lists(self, temp_dir):
+    def test_parse_lists(self, markdown_reader):
         """Test parsing ordered and unordered lists."""
         content = """- Item 1
 - Item 2
@@ -149,17 +135,13 @@ console.log("Hello");
 * Alternative bullet
 + Another bullet
 """
-        markdown_file = temp_dir / "lists.md"
-        markdown_file.write_text(content)
-
-        reader = MarkdownReader()
-        document = reader.read(markdown_file)
+        document = markdown_reader.read_string(content)
 
         lists = document.get_elements_by_type(ElementType.LIST)
         # Grouped lists: unordered (3 items), ordered (2 items), and alternative bullets
         assert len(lists) >= 3
 
-    def test_parse_paragraphs(self, temp_dir):
+    def test_parse_paragraphs(self, markdown_reader):
         """Test parsing paragraphs."""
         content = """First paragraph with some text.
 
@@ -169,11 +151,7 @@ Third paragraph
 with wrapped text
 on multiple lines.
 """
-        markdown_file = temp_dir / "paragraphs.md"
-        markdown_file.write_text(content)
-
-        reader = MarkdownReader()
-        document = reader.read(markdown_file)
+        document = markdown_reader.read_string(content)
 
         paragraphs = document.get_elements_by_type(ElementType.PARAGRAPH)
         assert len(paragraphs) == 3
@@ -182,34 +160,77 @@ on multiple lines.
         assert "Second paragraph" in paragraphs[1].content
         assert "Third paragraph" in paragraphs[2].content
 
-    def test_empty_markdown_file(self, temp_dir):
+    def test_windows_line_endings(self, temp_dir, markdown_reader):
+        """Test that CRLF files parse like LF files."""
+        markdown_file = temp_dir / "crlf.md"
+        markdown_file.write_bytes(b"# Title\r\n\r\n```\r\ncode line\r\n```\r\n")
+
+        document = markdown_reader.read(markdown_file)
+
+        code_blocks = document.get_elements_by_type(ElementType.CODE_BLOCK)
+        assert document.get_headings()[0].content == "Title"
+        assert code_blocks[0].content == "code line"
+
+    def test_read_many(self, temp_dir, markdown_reader):
+        """Test reading several files in order."""
+        first = temp_dir / "first.md"
+        second = temp_dir / "second.md"
+        first.write_text("# First")
+        second.write_text("# Second")
+
+        documents = markdown_reader.read_many([second, first])
+
+        assert [doc.title for doc in documents] == ["second", "first"]
+
+    def test_read_string(self, markdown_reader):
+        """Test parsing in-memory text with an explicit title."""
+        document = markdown_reader.read_string("# Heading\r\n\r\nText", title="notes")
+
+        assert document.title == "notes"
+        assert document.get_headings()[0].content == "Heading"
+        assert document.get_elements_by_type(ElementType.PARAGRAPH)[0].content == "Text"
+
+    def test_empty_markdown_file(self, temp_dir, markdown_reader):
         """Test handling empty markdown file."""
         markdown_file = temp_dir / "empty.md"
         markdown_file.write_text("")
 
-        reader = MarkdownReader()
-        document = reader.read(markdown_file)
+        document = markdown_reader.read(markdown_file)
 
         assert isinstance(document, Document)
         assert len(document.elements) == 0
 
 
+@pytest.fixture(scope="module")
+def mixed_markdown(markdown_writer):
+    """Markdown for one document holding every basic element type."""
+    document = Document()
+    document.add_heading("Level 1", level=1)
+    document.add_heading("Level 2", level=2)
+    document.add_heading("Level 3", level=3)
+    document.add_paragraph("First paragraph.")
+    document.add_paragraph("Second paragraph.")
+    document.add_list(["Item 1", "Item 2", "Item 3"], ordered=False)
+    document.add_list(["First", "Second", "Third"], ordered=True)
+    document.add_code_block('print("Hello")', language="python")
+    document.add_code_block("plain code")
+    return markdown_writer.to_string(document)
+
+
 class TestMarkdownWriter:
     """Test MarkdownWriter functionality."""
 
-    def test_supports_format_markdown(self):
+    def test_supports_format_markdown(self, markdown_writer):
         """Test that Markdown writer supports markdown files."""
-        writer = MarkdownWriter()
-        assert writer.supports_format("test.md") is True
-        assert writer.supports_format("test.markdown") is True
-        assert writer.supports_format("test.MD") is True
+        assert markdown_writer.supports_format("test.md") is True
+        assert markdown_writer.supports_format("test.markdown") is True
+        assert markdown_writer.supports_format("test.MD") is True
 
-    def test_supports_format_non_markdown(self):
+    def test_supports_format_non_markdown(self, markdown_writer):
         """Test that Markdown writer doesn't support non-markdown files."""
-        writer = MarkdownWriter()
-        assert writer.supports_format("test.pdf") is False
-        assert writer.supports_format("test.docx") is False
-        assert writer.supports_format("test.txt") is False
+        assert markdown_writer.supports_format("test.pdf") is False
+        assert markdown_writer.supports_format("test.docx") is False
+        assert markdown_writer.supports_format("test.txt") is False
 
     def test_get_supported_extensions(self):
         """Test getting supported extensions."""
@@ -217,144 +238,157 @@ class TestMarkdownWriter:
         assert '.md' in extensions
         assert '.markdown' in extensions
 
-    def test_to_string_with_title(self, sample_document):
+    def test_to_string_with_title(self, sample_document, markdown_writer):
         """Test converting document to string with title."""
-        writer = MarkdownWriter()
-        markdown_text = writer.to_string(sample_document)
+        markdown_text = markdown_writer.to_string(sample_document)
 
         assert "# Test Document" in markdown_text
         assert "# Chapter 1" in markdown_text
         assert "This is a paragraph" in markdown_text
 
-    def test_to_string_without_title(self):
+    def test_to_string_without_title(self, markdown_writer):
         """Test converting document to string without title."""
         document = Document()  # No title
         document.add_heading("Heading", level=1)
         document.add_paragraph("Paragraph")
 
-        writer = MarkdownWriter()
-        markdown_text = writer.to_string(document)
+        markdown_text = markdown_writer.to_string(document)
 
         assert "# Heading" in markdown_text
         assert "Paragraph" in markdown_text
         # Should not have a title line
         assert not markdown_text.startswith("# \n")
 
-    def test_convert_headings(self):
+    def test_convert_headings(self, mixed_markdown):
         """Test converting heading elements."""
-        writer = MarkdownWriter()
-        document = Document()
-        document.add_heading("Level 1", level=1)
-        document.add_heading("Level 2", level=2)
-        document.add_heading("Level 3", level=3)
-
-        markdown_text = writer.to_string(document)
+        assert "# Level 1" in mixed_markdown
+        assert "## Level 2" in mixed_markdown
+        assert "### Level 3" in mixed_markdown
 
-        assert "# Level 1" in markdown_text
-        assert "## Level 2" in markdown_text
-        assert "### Level 3" in markdown_text
-
-    def test_convert_paragraphs(self):
+    def test_convert_paragraphs(self, mixed_markdown):
         """Test converting paragraph elements."""
-        writer = MarkdownWriter()
-        document = Document()
-        document.add_paragraph("First paragraph.")
-        document.add_paragraph("Second paragraph.")
-
-        markdown_text = writer.to_string(document)
+        assert "First paragraph." in mixed_markdown
+        assert "Second paragraph." in mixed_markdown
 
-        assert "First paragraph." in markdown_text
-        assert "Second paragraph." in markdown_text
-
-    def test_convert_lists(self):
+    def test_convert_lists(self, mixed_markdown):
         """Test converting list elements."""
-        writer = MarkdownWriter()
-        document = Document()
-
-        # Unordered list
-        document.add_list(["Item 1", "Item 2", "Item 3"], ordered=False)
-
-        # Ordered list
-        document.add_list(["First", "Second", "Third"], ordered=True)
-
-        markdown_text = writer.to_string(document)
-
         # Check unordered list
-        assert "- Item 1" in markdown_text
-        assert "- Item 2" in markdown_text
-        assert "- Item 3" in markdown_text
+        assert "- Item 1" in mixed_markdown
+        assert "- Item 2" in mixed_markdown
+        assert "- Item 3" in mixed_markdown
 
         # Check ordered list
-        assert "1. First" in markdown_text
-        assert "2. Second" in markdown_text
-        assert "3. Third" in markdown_text
+        assert "1. First" in mixed_markdown
+        assert "2. Second" in mixed_markdown
+        assert "3. Third" in mixed_markdown
+
+    def test_convert_nested_lists(self, markdown_writer):
+        """Test converting nested lists, including very deep nesting."""
+        from src.core.document import DocumentList, ListItem
 
-    def test_convert_code_blocks(self):
-        """Test converting code block elements."""
-        writer = MarkdownWriter()
         document = Document()
 
-        # Code block with language
-        document.add_code_block('print("Hello")', language="python")
+        outer = document.add_list(["Outer", "Last"], ordered=True)
+        outer.items[0].children.append(DocumentList(items=[ListItem(content="a")]))
+        outer.items[0].children.append(DocumentList(items=[ListItem(content="b")], ordered=True))
 
-        # Code block without language
-        document.add_code_block("plain code")
+        assert markdown_writer.to_string(document) == "1. Outer\n  - a\n  1. b\n2. Last"
 
-        markdown_text = writer.to_string(document)
+        # Deeper than the default recursion limit
+        deep = DocumentList(items=[ListItem(content="level 0")])
+        current = deep
+        for level in range(1, 2000):
+            nested = DocumentList(items=[ListItem(content=f"level {level}")])
+            current.items[0].children.append(nested)
+            current = nested
 
-        assert "```python" in markdown_text
-        assert 'print("Hello")' in markdown_text
-        assert "```\nplain code\n```" in markdown_text
+        deep_document = Document()
+        deep_document.add_element(deep)
+        lines = markdown_writer.to_string(deep_document).split("\n")
 
-    def test_write_to_file(self, sample_document, temp_dir):
+        assert len(lines) == 2000
+        assert lines[-1] == "  " * 1999 + "- level 1999"
+
+    def test_convert_code_blocks(self, mixed_markdown):
+        """Test converting code block elements."""
+        assert "```python" in mixed_markdown
+        assert 'print("Hello")' in mixed_markdown
+        assert "```\nplain code\n```" in mixed_markdown
+
+    def test_write_to_file(self, sample_document, temp_dir, markdown_writer):
         """Test writing document to file."""
-        writer = MarkdownWriter()
         output_file = temp_dir / "output.md"
 
-        writer.write(sample_document, output_file)
+        markdown_writer.write(sample_document, output_file)
 
         assert output_file.exists()
         content = output_file.read_text(encoding='utf-8')
         assert "# Test Document" in content
         assert "Chapter 1" in content
 
-    def test_write_unsupported_format(self, sample_document, temp_dir):
+    def test_failed_write_keeps_existing_file(self, temp_dir, markdown_writer):
+        """Test that a conversion error leaves the previous output intact."""
+        output_file = temp_dir / "out.md"
+        output_file.write_text("PREVIOUS GOOD CONTENT")
+
+        document = Document(title="T")
+        document.add_paragraph("x" * 10)
+        document.add_heading("Broken", level=1).attributes["level"] = "2"
+
+        with pytest.raises(IOError, match="Error writing to file"):
+            markdown_writer.write(document, output_file)
+
+        assert output_file.read_text() == "PREVIOUS GOOD CONTENT"
+        assert [path.name for path in temp_dir.iterdir()] == ["out.md"]
+
+    def test_write_replaces_existing_file(self, sample_document, temp_dir, markdown_writer):
+        """Test that a successful write replaces the file and keeps its mode."""
+        output_file = temp_dir / "out.md"
+        output_file.write_text("old")
+        output_file.chmod(0o640)
+
+        markdown_writer.write(sample_document, output_file)
+
+        assert output_file.read_text() == markdown_writer.to_string(sample_document)
+        assert output_file.stat().st_mode & 0o777 == 0o640
+        assert [path.name for path in temp_dir.iterdir()] == ["out.md"]
+
+    def test_write_through_symlink_keeps_link(self, sample_document, temp_dir, markdown_writer):
+        """Test that writing to a symlink updates its target, not the link."""
+        target = temp_dir / "target.md"
+        target.write_text("old")
+        link = temp_dir / "link.md"
+        link.symlink_to(target)
+
+        markdown_writer.write(sample_document, link)
+
+        assert link.is_symlink()
+        assert target.read_text() == markdown_writer.to_string(sample_document)
+
+    def test_write_unsupported_format(self, sample_document, temp_dir, markdown_writer):
         """Test writing to unsupported format."""
-        writer = MarkdownWriter()
         output_file = temp_dir / "output.pdf"
 
         with pytest.raises(ValueError, match="Unsupported output format"):
-            writer.write(sample_document, output_file)
+            markdown_writer.write(sample_document, output_file)
 
-    def test_to_string_invalid_input(self):
+    def test_to_string_invalid_input(self, markdown_writer):
         """Test to_string with invalid input."""
-        writer = MarkdownWriter()
-
         with pytest.raises(ValueError, match="Input must be a Document object"):
-            writer.to_string("not a document")
+            markdown_writer.to_string("not a document")
 
-    def test_empty_document(self):
+    def test_empty_document(self, markdown_writer):
         """Test converting empty document."""
-        writer = MarkdownWriter()
         document = Document()
 
-        markdown_text = writer.to_string(document)
+        markdown_text = markdown_writer.to_string(document)
         assert markdown_text == ""
 
-    def test_roundtrip_conversion(self, temp_dir, sample_markdown_content):
+    def test_roundtrip_conversion(self, temp_dir, parsed_sample, markdown_writer):
         """Test reading and writing markdown (roundtrip)."""
-        # Write sample content to file
-        input_file = temp_dir / "input.md"
-        input_file.write_text(sample_markdown_content)
-
-        # Read with reader
-        reader = MarkdownReader()
-        document = reader.read(input_file)
-
-        # Write with writer
-        writer = MarkdownWriter()
+        # Write the document read from the sample file
         output_file = temp_dir / "output.md"
-        writer.write(document, output_file)
+        markdown_writer.write(parsed_sample, output_file)
 
         # Verify output file exists and has content
         assert output_file.exists()
@@ -3,12 +3,47 @@ Unit tests for PDF reader.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
-from src.readers.pdf_reader import PDFReader
+from src.readers.pdf_reader import PDFReader, _classify_heading
 from src.core.document import Document, ElementType
 
 
+def make_page_dict(text, size=11.0):
+    """Build a minimal PyMuPDF "dict" extraction with one font size."""
+    lines = [{"spans": [{"text": line, "size": size}]} for line in text.split("\n")]
+    return {"blocks": [{"type": 0, "lines": lines}]}
+
+
+@pytest.fixture
+def mock_fitz(monkeypatch):
+    """Replace the PyMuPDF module used by the PDF reader."""
+    mock_module = MagicMock()
+    monkeypatch.setattr('src.readers.pdf_reader.fitz', mock_module)
+    return mock_module
+
+
+class InlineExecutor:
+    """ProcessPoolExecutor stand-in that records its size and maps in-process."""
+
+    instances = []
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self.calls = []
+        InlineExecutor.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, *iterables):
+        self.calls.append(iterables)
+        return map(fn, *iterables)
+
+
 class TestPDFReader:
     """Test PDFReader functionality."""
 
@@ -30,9 +65,16 @@ class TestPDFReader:
         extensions = PDFReader.get_supported_extensions()
         assert extensions == ['.pdf']
 
-    @patch('src.readers.pdf_reader.fitz')
     def test_read_nonexistent_file(self, mock_fitz):
         """Test reading a file that doesn't exist."""
+        mock_fitz.open.side_effect = FileNotFoundError("no such file")
+        reader = PDFReader()
+
+        with pytest.raises(FileNotFoundError, match="PDF file not found"):
+            reader.read("/nonexistent/file.pdf")
+
+    def test_read_nonexistent_file_real_fitz(self):
+        """Test that PyMuPDF's own missing-file error is translated."""
         reader = PDFReader()
 
         with pytest.raises(FileNotFoundError, match="PDF file not found"):
@@ -47,7 +89,6 @@ class TestPDFReader:
         with pytest.raises(ValueError, match="Unsupported file format"):
             reader.read(unsupported_file)
 
-    @patch('src.readers.pdf_reader.fitz')
     def test_read_pdf_success(self, mock_fitz, temp_dir, sample_pdf_content):
         """Test successfully reading a PDF file."""
         # Create a test PDF file
@@ -57,10 +98,10 @@ class TestPDFReader:
         # Mock PyMuPDF
         mock_doc = Mock()
         mock_page = Mock()
-        mock_page.get_text.return_value = sample_pdf_content
-        # Properly mock length and indexing
+        mock_page.get_text.return_value = make_page_dict(sample_pdf_content)
+        # Properly mock page iteration
         mock_doc.__len__ = Mock(return_value=1)
-        mock_doc.__getitem__ = Mock(return_value=mock_page)
+        mock_doc.__iter__ = Mock(return_value=iter([mock_page]))
         mock_fitz.open.return_value = mock_doc
 
         reader = PDFReader()
@@ -74,7 +115,6 @@ class TestPDFReader:
         mock_fitz.open.assert_called_once_with(pdf_file)
         mock_doc.close.assert_called_once()
 
-    @patch('src.readers.pdf_reader.fitz')
     def test_read_pdf_exception(self, mock_fitz, temp_dir):
         """Test handling exceptions during PDF processing."""
         pdf_file = temp_dir / "test.pdf"
@@ -86,39 +126,38 @@ class TestPDFReader:
         with pytest.raises(Exception, match="Error processing PDF"):
             reader.read(pdf_file)
 
-    def test_is_heading_detection(self):
-        """Test heading detection logic."""
-        reader = PDFReader()
-
-        # Test uppercase headings
-        assert reader._is_heading("CHAPTER ONE") is True
+    def test_classify_heading(self):
+        """Test heading detection and level assignment."""
+        # Uppercase headings are level 1
+        assert _classify_heading("CHAPTER ONE") == 1
 
-        # Test numbered headings
-        assert reader._is_heading("1. Introduction") is True
-        assert reader._is_heading("2.1 Overview") is True
+        # Numbered headings are level 2
+        assert _classify_heading("1. Introduction") == 2
+        assert _classify_heading("2.1 Overview") == 2
+        assert _classify_heading("1. INTRODUCTION") == 2
 
-        # Test capitalized headings
-        assert reader._is_heading("Introduction") is True
+        # Capitalized headings are level 2
+        assert _classify_heading("Introduction") == 2
 
-        # Test non-headings
-        assert reader._is_heading("This is a regular paragraph.") is False
+        # Non-headings
+        assert _classify_heading("This is a regular paragraph.") is None
         long_text = ("This is a very long line that should not be "
                      "considered a heading because it exceeds the length limit.")
-        assert reader._is_heading(long_text) is False
+        assert _classify_heading(long_text) is None
 
-    def test_determine_heading_level(self):
-        """Test heading level determination."""
+    def test_heading_checks_use_precompiled_patterns(self, monkeypatch):
+        """Test that heading and cleanup checks compile no patterns per call."""
         reader = PDFReader()
 
-        # Numbered headings should be level 2
-        assert reader._determine_heading_level("1. Introduction") == 2
-        assert reader._determine_heading_level("2.1 Overview") == 2
+        def fail_compile(*args, **kwargs):
+            raise AssertionError("re.compile called")
 
-        # All caps should be level 1
-        assert reader._determine_heading_level("CHAPTER ONE") == 1
+        monkeypatch.setattr('re.compile', fail_compile)
+        monkeypatch.setattr('re._compile', fail_compile)
 
-        # Other headings should be level 2
-        assert reader._determine_heading_level("Introduction") == 2
+        assert _classify_heading("1. Introduction") == 2
+        assert _classify_heading("CHAPTER ONE") == 1
+        assert reader._clean_text("Hello.World") == "Hello. World"
 
     def test_format_heading_text(self):
         """Test heading text formatting."""
@@ -131,6 +170,30 @@ class TestPDFReader:
         assert reader._format_heading_text("Introduction") == "Introduction"
         assert reader._format_heading_text("1. Overview") == "1. Overview"
 
+    def test_process_page_text_without_uppercase(self):
+        """Test that pages without uppercase letters skip heading detection."""
+        reader = PDFReader()
+        document = Document()
+
+        with patch('src.readers.pdf_reader._classify_heading') as mock_classify:
+            reader._process_page_text("  first   line\n\nsecond line.  \n", document)
+
+        mock_classify.assert_not_called()
+        assert [e.content for e in document.elements] == ["first line", "second line."]
+        assert all(e.element_type == ElementType.PARAGRAPH for e in document.elements)
+
+    def test_process_page_text_uppercase_without_lowercase_form(self):
+        """Test that uppercase letters with no lowercase form still form headings."""
+        reader = PDFReader()
+        document = Document()
+
+        reader._process_page_text("ℍℝ\n", document)
+
+        heading, = document.elements
+        assert heading.element_type == ElementType.HEADING
+        assert heading.content == "ℍℝ"
+        assert heading.level == 1
+
     def test_clean_text(self):
         """Test text cleaning functionality."""
         reader = PDFReader()
@@ -143,7 +206,6 @@ class TestPDFReader:
         assert reader._clean_text("End!Next") == "End! Next"
         assert reader._clean_text("Question?Answer") == "Question? Answer"
 
-    @patch('src.readers.pdf_reader.fitz')
     def test_process_page_text(self, mock_fitz, temp_dir):
         """Test processing of page text."""
         pdf_file = temp_dir / "test.pdf"
@@ -162,9 +224,9 @@ Another paragraph here."""
 
         mock_doc = Mock()
         mock_page = Mock()
-        mock_page.get_text.return_value = test_text
+        mock_page.get_text.return_value = make_page_dict(test_text)
         mock_doc.__len__ = Mock(return_value=1)
-        mock_doc.__getitem__ = Mock(return_value=mock_page)
+        mock_doc.__iter__ = Mock(return_value=iter([mock_page]))
         mock_fitz.open.return_value = mock_doc
 
         reader = PDFReader()
@@ -182,7 +244,6 @@ Another paragraph here."""
         assert "Main Heading" in heading_contents  # Should be title-cased
         assert "1. Section One" in heading_contents
 
-    @patch('src.readers.pdf_reader.fitz')
     def test_empty_pdf_pages(self, mock_fitz, temp_dir):
         """Test handling of empty PDF pages."""
         pdf_file = temp_dir / "test.pdf"
@@ -190,9 +251,9 @@ Another paragraph here."""
 
         mock_doc = Mock()
         mock_page = Mock()
-        mock_page.get_text.return_value = ""  # Empty page
+        mock_page.get_text.return_value = make_page_dict("")  # Empty page
         mock_doc.__len__ = Mock(return_value=1)
-        mock_doc.__getitem__ = Mock(return_value=mock_page)
+        mock_doc.__iter__ = Mock(return_value=iter([mock_page]))
         mock_fitz.open.return_value = mock_doc
 
         reader = PDFReader()
@@ -201,7 +262,6 @@ Another paragraph here."""
         assert isinstance(document, Document)
         assert len(document.elements) == 0  # No content should be added
 
-    @patch('src.readers.pdf_reader.fitz')
     def test_multiple_pages(self, mock_fitz, temp_dir):
         """Test processing multiple PDF pages."""
         pdf_file = temp_dir / "test.pdf"
@@ -209,14 +269,14 @@ Another paragraph here."""
 
         # Create mock pages
         mock_page1 = Mock()
-        mock_page1.get_text.return_value = "Page 1 content\nFirst paragraph."
+        mock_page1.get_text.return_value = make_page_dict("Page 1 content\nFirst paragraph.")
 
         mock_page2 = Mock()
-        mock_page2.get_text.return_value = "Page 2 content\nSecond paragraph."
+        mock_page2.get_text.return_value = make_page_dict("Page 2 content\nSecond paragraph.")
 
         mock_doc = Mock()
         mock_doc.__len__ = Mock(return_value=2)
-        mock_doc.__getitem__ = Mock(side_effect=[mock_page1, mock_page2])
+        mock_doc.__iter__ = Mock(return_value=iter([mock_page1, mock_page2]))
         mock_fitz.open.return_value = mock_doc
 
         reader = PDFReader()
@@ -227,4 +287,105 @@ Another paragraph here."""
         # Verify content from both pages is present
         text_content = document.get_text_content()
         assert "Page 1 content" in text_content
-        assert "Page 2 content" in text_content
\ No newline at end of file
+        assert "Page 2 content" in text_content
+
+    def test_font_size_headings(self, mock_fitz, temp_dir):
+        """Test that larger fonts are classified as headings."""
+        pdf_file = temp_dir / "test.pdf"
+        pdf_file.write_text("fake pdf content")
+
+        mock_page = Mock()
+        mock_page.get_text.return_value = {"blocks": [
+            {"type": 0, "lines": [
+                {"spans": [{"text": "Document title", "size": 24.0}]},
+                {"spans": [{"text": "Section", "size": 14.0}]},
+                {"spans": [{"text": "Body text without a period", "size": 11.0}]},
+                {"spans": [{"text": "More body text", "size": 11.0}]},
+            ]},
+            {"type": 1, "image": b""},
+        ]}
+
+        mock_doc = Mock()
+        mock_doc.__len__ = Mock(return_value=1)
+        mock_doc.__iter__ = Mock(return_value=iter([mock_page]))
+        mock_fitz.open.return_value = mock_doc
+
+        reader = PDFReader()
+        document = reader.read(pdf_file)
+
+        mock_page.get_text.assert_called_once_with("dict", flags=mock_fitz.TEXTFLAGS_TEXT)
+        headings = document.get_headings()
+        assert [(h.content, h.level) for h in headings] == [
+            ("Document title", 1),
+            ("Section", 2),
+        ]
+        paragraphs = document.get_elements_by_type(ElementType.PARAGRAPH)
+        assert [p.content for p in paragraphs] == [
+            "Body text without a period",
+            "More body text",
+        ]
+
+    def test_parallel_extraction_matches_serial(self, temp_dir):
+        """Test that large PDFs extracted by worker processes keep page order."""
+        import fitz
+
+        pdf_file = temp_dir / "large.pdf"
+        pdf = fitz.open()
+        for page_num in range(1, 17):
+            page = pdf.new_page()
+            page.insert_text((72, 72), f"Chapter {page_num}", fontsize=20)
+            page.insert_text((72, 120), f"body text for page {page_num}", fontsize=11)
+        pdf.save(pdf_file)
+        pdf.close()
+
+        serial = PDFReader().read(pdf_file)
+        parallel = PDFReader(num_workers=2).read(pdf_file)
+
+        assert [e.content for e in parallel] == [e.content for e in serial]
+        assert [h.content for h in parallel.get_headings()] == [
+            f"Chapter {page_num}" for page_num in range(1, 17)
+        ]
+
+    def test_parallel_extraction_dispatch(self, mock_fitz, temp_dir, monkeypatch):
+        """Test that page ranges are dispatched to a pool capped by num_workers."""
+        monkeypatch.setattr('src.readers.pdf_reader.ProcessPoolExecutor', InlineExecutor)
+        monkeypatch.setattr(InlineExecutor, 'instances', [])
+        pdf_file = temp_dir / "test.pdf"
+
+        pages = [Mock() for _ in range(16)]
+        for page_num, page in enumerate(pages):
+            page.get_text.return_value = make_page_dict(f"page {page_num}")
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = len(pages)
+        mock_doc.__getitem__.side_effect = pages.__getitem__
+        mock_doc.__enter__.return_value = mock_doc
+        mock_fitz.open.return_value = mock_doc
+
+        document = PDFReader(num_workers=2).read(pdf_file)
+
+        executor, = InlineExecutor.instances
+        assert executor.max_workers == 2
+        sources, starts, stops = executor.calls[0]
+        assert sources == [str(pdf_file)] * 2
+        assert (starts, stops) == ([0, 8], [8, 16])
+        assert [e.content for e in document] == [f"page {n}" for n in range(16)]
+
+    @pytest.mark.parametrize("num_workers", [None, 1])
+    def test_single_worker_extracts_in_process(self, mock_fitz, temp_dir, monkeypatch,
+                                               num_workers):
+        """Test that the default reader and num_workers=1 never start a pool."""
+        monkeypatch.setattr('src.readers.pdf_reader.ProcessPoolExecutor', InlineExecutor)
+        monkeypatch.setattr(InlineExecutor, 'instances', [])
+
+        pages = [Mock() for _ in range(16)]
+        for page in pages:
+            page.get_text.return_value = make_page_dict("text")
+        mock_doc = MagicMock()
+        mock_doc.__len__.return_value = len(pages)
+        mock_doc.__iter__.return_value = iter(pages)
+        mock_fitz.open.return_value = mock_doc
+
+        document = PDFReader(num_workers=num_workers).read(temp_dir / "test.pdf")
+
+        assert InlineExecutor.instances == []
+        assert len(document) == 16
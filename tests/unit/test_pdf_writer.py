@@ -6,10 +6,37 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock, call
 from pathlib import Path
 
-from src.writers.pdf_writer import PDFWriter
+from src.writers.pdf_writer import (
+    PDFWriter, _get_style_sheet, _make_paragraph, _register_unicode_font,
+    _resolve_unicode_font
+)
 from src.core.document import Document, ElementType
 
 
+@pytest.fixture(autouse=True)
+def fresh_style_sheet():
+    """Drop the cached style sheet so patched style sheets take effect."""
+    _get_style_sheet.cache_clear()
+    yield
+    _get_style_sheet.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def pdf_styles():
+    """Mock style sheet with every style the writer looks up.
+
+    Shared by the module's tests, which must not modify it.
+    """
+    styles = {
+        'Title': Mock(fontName='Helvetica-Bold'),
+        'Normal': Mock(fontName='Helvetica'),
+        'Code': Mock(fontName='Courier'),
+    }
+    for level in range(1, 7):
+        styles[f'Heading{level}'] = Mock(fontName='Helvetica-Bold')
+    return styles
+
+
 class TestPDFWriter:
     """Test PDFWriter functionality."""
 
@@ -31,6 +58,50 @@ class TestPDFWriter:
         extensions = PDFWriter.get_supported_extensions()
         assert extensions == ['.pdf']
 
+    def test_unicode_font_resolved_once(self):
+        """Test that the font paths are probed once for all writers."""
+        _register_unicode_font.cache_clear()
+        try:
+            with patch('src.writers.pdf_writer._UNICODE_FONT_PATHS', ()):
+                with pytest.warns(UserWarning, match="Using Courier as fallback") as record:
+                    first = PDFWriter()
+                    second = PDFWriter()
+        finally:
+            _register_unicode_font.cache_clear()
+
+        assert len(record) == 1
+        assert first._unicode_font_name == second._unicode_font_name == 'Courier'
+
+    def test_unicode_font_parsed_once_by_concurrent_writers(self, temp_dir):
+        """Test that racing first lookups parse the font file only once."""
+        import threading
+        import time
+
+        font_file = temp_dir / "DejaVuSansMono.ttf"
+        font_file.write_bytes(b"")
+
+        def slow_font(*args):
+            time.sleep(0.05)
+            return Mock()
+
+        _register_unicode_font.cache_clear()
+        try:
+            with patch('src.writers.pdf_writer._UNICODE_FONT_PATHS', (font_file,)), \
+                    patch('src.writers.pdf_writer.TTFont', side_effect=slow_font) as mock_font, \
+                    patch('src.writers.pdf_writer.pdfmetrics.registerFont'):
+                results = []
+                threads = [threading.Thread(target=lambda: results.append(_resolve_unicode_font()))
+                           for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            _register_unicode_font.cache_clear()
+
+        assert mock_font.call_count == 1
+        assert results == ['DejaVuSansMono'] * 4
+
     def test_to_string_document_summary(self, sample_document):
         """Test to_string returns document summary."""
         writer = PDFWriter()
@@ -53,7 +124,8 @@ class TestPDFWriter:
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
     @patch('src.writers.pdf_writer.Paragraph')
     def test_create_pdf_document_with_title(self, mock_paragraph, mock_styles,
-                                           mock_doc_template, mock_paragraph_style, sample_document):
+                                           mock_doc_template, mock_paragraph_style,
+                                           sample_document, pdf_styles):
         """Test creating PDF document with title."""
         mock_pdf_doc = Mock()
         mock_pdf_doc.leftMargin = 72
@@ -65,26 +137,7 @@ class TestPDFWriter:
         # Mock ParagraphStyle to return a mock style
         mock_paragraph_style.return_value = Mock()
 
-        # Create properly configured style mocks with all required styles
-        mock_title_style = Mock()
-        mock_title_style.fontName = 'Helvetica-Bold'
-        mock_normal_style = Mock()
-        mock_normal_style.fontName = 'Helvetica'
-        mock_code_style = Mock()
-        mock_code_style.fontName = 'Courier'
-
-        # Create all heading styles
-        mock_styles_dict = {
-            'Title': mock_title_style,
-            'Normal': mock_normal_style,
-            'Code': mock_code_style,
-        }
-        for level in range(1, 7):
-            style = Mock()
-            style.fontName = 'Helvetica-Bold'
-            mock_styles_dict[f'Heading{level}'] = style
-
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         writer = PDFWriter()
         output_path = Path("test.pdf")
@@ -96,7 +149,7 @@ class TestPDFWriter:
     @patch('src.writers.pdf_writer.BaseDocTemplate')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
     @patch('src.writers.pdf_writer.Paragraph')
-    def test_create_pdf_document_without_title(self, mock_paragraph, mock_styles, mock_doc_template):
+    def test_create_pdf_document_without_title(self, mock_paragraph, mock_styles, mock_doc_template, pdf_styles):
         """Test creating PDF document without title."""
         mock_pdf_doc = Mock()
         mock_pdf_doc.leftMargin = 72
@@ -105,11 +158,7 @@ class TestPDFWriter:
         mock_pdf_doc.height = 648
         mock_doc_template.return_value = mock_pdf_doc
 
-        # Create properly configured style mocks
-        mock_normal_style = Mock()
-        mock_normal_style.fontName = 'Helvetica'
-        mock_styles_dict = {'Normal': mock_normal_style}
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         document = Document()  # No title
         document.add_paragraph("Test paragraph")
@@ -123,110 +172,142 @@ class TestPDFWriter:
 
     @patch('src.writers.pdf_writer.Paragraph')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
-    def test_convert_heading(self, mock_styles, mock_paragraph):
+    def test_convert_heading(self, mock_styles, mock_paragraph, pdf_styles):
         """Test converting heading elements to PDF."""
-        mock_styles_dict = {
-            'Heading1': Mock(),
-            'Heading2': Mock(),
-            'Heading3': Mock(),
-            'Heading4': Mock(),
-            'Heading5': Mock(),
-            'Heading6': Mock()
-        }
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         document = Document()
         heading = document.add_heading("Test Heading", level=2)
 
         writer = PDFWriter()
-        result = writer._convert_heading(heading, mock_styles_dict)
+        result = writer._convert_heading(heading, pdf_styles)
 
         # Verify Paragraph was created with correct style
-        mock_paragraph.assert_called_once_with("Test Heading", mock_styles_dict['Heading2'])
+        mock_paragraph.assert_called_once_with("Test Heading", pdf_styles['Heading2'])
 
     @patch('src.writers.pdf_writer.Paragraph')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
-    def test_convert_paragraph(self, mock_styles, mock_paragraph):
+    def test_convert_paragraph(self, mock_styles, mock_paragraph, pdf_styles):
         """Test converting paragraph elements to PDF."""
-        mock_styles_dict = {'Normal': Mock()}
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         document = Document()
         para = document.add_paragraph("Test paragraph content")
 
         writer = PDFWriter()
-        result = writer._convert_paragraph(para, mock_styles_dict)
+        result = writer._convert_paragraph(para, pdf_styles)
 
         # Verify Paragraph was created
-        mock_paragraph.assert_called_once_with("Test paragraph content", mock_styles_dict['Normal'])
+        mock_paragraph.assert_called_once_with("Test paragraph content", pdf_styles['Normal'])
 
     @patch('src.writers.pdf_writer.ListFlowable')
-    @patch('src.writers.pdf_writer.ListItem')
     @patch('src.writers.pdf_writer.Paragraph')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
     def test_convert_unordered_list(self, mock_styles, mock_paragraph,
-                                    mock_list_item, mock_list_flowable):
+                                    mock_list_flowable, pdf_styles):
         """Test converting unordered list to PDF."""
-        mock_styles_dict = {'Normal': Mock()}
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         document = Document()
         list_elem = document.add_list(["Item 1", "Item 2"], ordered=False)
 
         writer = PDFWriter()
-        result = writer._convert_list(list_elem, mock_styles_dict)
+        result = writer._convert_list(list_elem, pdf_styles)
 
-        # Verify ListFlowable was created for each item (2 items = 2 calls)
-        assert mock_list_flowable.call_count == 2
+        # Verify one ListFlowable holds both items
+        assert mock_list_flowable.call_count == 1
+        assert len(mock_list_flowable.call_args[0][0]) == 2
         # Check that bulletType is 'bullet' for unordered lists
         for call in mock_list_flowable.call_args_list:
             assert call[1]['bulletType'] == 'bullet'
 
     @patch('src.writers.pdf_writer.ListFlowable')
-    @patch('src.writers.pdf_writer.ListItem')
     @patch('src.writers.pdf_writer.Paragraph')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
     def test_convert_ordered_list(self, mock_styles, mock_paragraph,
-                                  mock_list_item, mock_list_flowable):
+                                  mock_list_flowable, pdf_styles):
         """Test converting ordered list to PDF."""
-        mock_styles_dict = {'Normal': Mock()}
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         document = Document()
         list_elem = document.add_list(["Item 1", "Item 2"], ordered=True)
 
         writer = PDFWriter()
-        result = writer._convert_list(list_elem, mock_styles_dict)
+        result = writer._convert_list(list_elem, pdf_styles)
 
-        # Verify ListFlowable was created for each item (2 items = 2 calls)
-        assert mock_list_flowable.call_count == 2
+        # Verify one ListFlowable holds both items
+        assert mock_list_flowable.call_count == 1
+        assert len(mock_list_flowable.call_args[0][0]) == 2
         # Check that bulletType is '1' for ordered lists
         for call in mock_list_flowable.call_args_list:
             assert call[1]['bulletType'] == '1'
 
+    @patch('src.writers.pdf_writer.ListFlowable')
+    @patch('src.writers.pdf_writer.Paragraph')
+    def test_convert_nested_list(self, mock_paragraph, mock_list_flowable):
+        """Test that nested lists are placed inside their parent item."""
+        from src.core.document import DocumentList, ListItem
+
+        document = Document()
+        list_elem = document.add_list(["One", "Two", "Three"], ordered=True)
+        list_elem.items[1].children.append(DocumentList(items=[ListItem(content="Nested")]))
+
+        nested_flowable, outer_flowable = Mock(), Mock()
+        mock_list_flowable.side_effect = [nested_flowable, outer_flowable]
+
+        writer = PDFWriter()
+        result = writer._convert_list(list_elem, {'Normal': Mock()})
+
+        assert result == [outer_flowable]
+        nested_call, outer_call = mock_list_flowable.call_args_list
+        assert nested_call[1]['bulletType'] == 'bullet'
+        assert nested_call[1]['leftIndent'] == 30
+        assert outer_call[1]['bulletType'] == '1'
+        assert outer_call[1]['leftIndent'] == 20
+
+        entries = outer_call[0][0]
+        assert [len(entry) for entry in entries] == [1, 2, 1]
+        assert entries[1][1] is nested_flowable
+
     @patch('src.writers.pdf_writer.Preformatted')
     @patch('src.writers.pdf_writer.ParagraphStyle')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
-    def test_convert_code_block(self, mock_styles, mock_para_style, mock_preformatted):
+    def test_convert_code_block(self, mock_styles, mock_para_style, mock_preformatted, pdf_styles):
         """Test converting code block to PDF."""
-        mock_styles_dict = {'Code': Mock()}
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         document = Document()
         code = document.add_code_block("print('hello')", language="python")
 
         writer = PDFWriter()
-        result = writer._convert_code_block(code, mock_styles_dict)
+        result = writer._convert_code_block(code, pdf_styles)
 
         # Verify Preformatted was created
         mock_preformatted.assert_called_once()
         assert "print('hello')" in str(mock_preformatted.call_args)
 
+    @patch('src.writers.pdf_writer.Preformatted')
+    @patch('src.writers.pdf_writer.ParagraphStyle')
+    def test_code_style_built_once_per_style_sheet(self, mock_para_style, mock_preformatted):
+        """Test that code blocks sharing a style sheet share one style."""
+        styles = {'Code': Mock()}
+        document = Document()
+        first = document.add_code_block("a = 1")
+        second = document.add_code_block("b = 2")
+
+        writer = PDFWriter()
+        writer._convert_code_block(first, styles)
+        writer._convert_code_block(second, styles)
+        assert mock_para_style.call_count == 1
+
+        writer._convert_code_block(first, {'Code': Mock()})
+        assert mock_para_style.call_count == 2
+
     @patch('src.writers.pdf_writer.ParagraphStyle')
     @patch('src.writers.pdf_writer.BaseDocTemplate')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
     @patch('src.writers.pdf_writer.Paragraph')
-    def test_write_to_file(self, mock_paragraph, mock_styles, mock_doc_template, mock_paragraph_style, sample_document, temp_dir):
+    def test_write_to_file(self, mock_paragraph, mock_styles, mock_doc_template, mock_paragraph_style, sample_document, temp_dir, pdf_styles):
         """Test writing document to file."""
         mock_pdf_doc = Mock()
         mock_pdf_doc.leftMargin = 72
@@ -238,26 +319,7 @@ class TestPDFWriter:
         # Mock ParagraphStyle to return a mock style
         mock_paragraph_style.return_value = Mock()
 
-        # Create properly configured style mocks with all required styles
-        mock_title_style = Mock()
-        mock_title_style.fontName = 'Helvetica-Bold'
-        mock_normal_style = Mock()
-        mock_normal_style.fontName = 'Helvetica'
-        mock_code_style = Mock()
-        mock_code_style.fontName = 'Courier'
-
-        # Create all heading styles
-        mock_styles_dict = {
-            'Title': mock_title_style,
-            'Normal': mock_normal_style,
-            'Code': mock_code_style,
-        }
-        for level in range(1, 7):
-            style = Mock()
-            style.fontName = 'Helvetica-Bold'
-            mock_styles_dict[f'Heading{level}'] = style
-
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         writer = PDFWriter()
         output_file = temp_dir / "output.pdf"
@@ -271,6 +333,33 @@ class TestPDFWriter:
         # Verify PDF was built
         mock_pdf_doc.build.assert_called_once()
 
+    def test_write_multi_page_document(self, temp_dir):
+        """Test that a document spanning several pages builds."""
+        document = Document(title="Long Document")
+        for i in range(400):
+            document.add_paragraph(f"Paragraph {i} " * 10)
+
+        writer = PDFWriter()
+        output_file = temp_dir / "long.pdf"
+        writer.write(document, output_file)
+
+        assert output_file.stat().st_size > 0
+
+    def test_style_sheet_shared_between_documents(self, temp_dir):
+        """Test that successive documents reuse one style sheet."""
+        writer = PDFWriter()
+        document = Document()
+        document.add_paragraph("Content")
+
+        from reportlab.lib.styles import getSampleStyleSheet
+
+        with patch('src.writers.pdf_writer.getSampleStyleSheet',
+                   wraps=getSampleStyleSheet) as mock_styles:
+            writer.write(document, temp_dir / "first.pdf")
+            writer.write(document, temp_dir / "second.pdf")
+
+        mock_styles.assert_called_once()
+
     def test_write_unsupported_format(self, sample_document, temp_dir):
         """Test writing to unsupported format."""
         writer = PDFWriter()
@@ -315,10 +404,9 @@ class TestPDFWriter:
 
     @patch('src.writers.pdf_writer.Paragraph')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
-    def test_unknown_element_type(self, mock_styles, mock_paragraph):
+    def test_unknown_element_type(self, mock_styles, mock_paragraph, pdf_styles):
         """Test handling unknown element types."""
-        mock_styles_dict = {'Normal': Mock()}
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         # Create a custom element with unknown type
         from src.core.document import DocumentElement
@@ -331,37 +419,36 @@ class TestPDFWriter:
         unknown_element = UnknownElement()
 
         writer = PDFWriter()
-        result = writer._convert_element_to_flowable(unknown_element, mock_styles_dict)
+        result = writer._convert_element_to_flowable(unknown_element, pdf_styles)
 
         # Should fall back to creating a Paragraph
-        mock_paragraph.assert_called_once_with("Unknown content", mock_styles_dict['Normal'])
+        mock_paragraph.assert_called_once_with("Unknown content", pdf_styles['Normal'])
 
-    def test_list_without_items(self):
+    def test_list_without_items(self, pdf_styles):
         """Test handling list elements without items."""
         writer = PDFWriter()
 
-        # Create a mock list element without items
+        # Create a mock list element with no items
         class MockDocumentList:
             def __init__(self):
                 self.element_type = ElementType.LIST
                 self.attributes = {"ordered": False}
+                self.items = []
 
-        mock_styles_dict = {'Normal': Mock()}
         mock_list = MockDocumentList()
 
         # Should return None when list has no items
-        result = writer._convert_list(mock_list, mock_styles_dict)
+        result = writer._convert_list(mock_list, pdf_styles)
         assert result is None
 
     @patch('src.writers.pdf_writer.BaseDocTemplate')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
     @patch('src.writers.pdf_writer.Paragraph')
-    def test_element_with_no_content(self, mock_paragraph, mock_styles, mock_doc_template):
+    def test_element_with_no_content(self, mock_paragraph, mock_styles, mock_doc_template, pdf_styles):
         """Test handling elements with no content."""
         mock_pdf_doc = Mock()
         mock_doc_template.return_value = mock_pdf_doc
-        mock_styles_dict = {'Normal': Mock()}
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         # Create element with empty content
         from src.core.document import Paragraph as DocParagraph
@@ -369,24 +456,16 @@ class TestPDFWriter:
         element = DocParagraph(content="")
 
         writer = PDFWriter()
-        result = writer._convert_element_to_flowable(element, mock_styles_dict)
+        result = writer._convert_element_to_flowable(element, pdf_styles)
 
         # Should still create a Paragraph even with empty content
         assert result is not None
 
     @patch('src.writers.pdf_writer.Paragraph')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
-    def test_heading_level_mapping(self, mock_styles, mock_paragraph):
+    def test_heading_level_mapping(self, mock_styles, mock_paragraph, pdf_styles):
         """Test that heading levels map correctly to PDF styles."""
-        mock_styles_dict = {
-            'Heading1': Mock(),
-            'Heading2': Mock(),
-            'Heading3': Mock(),
-            'Heading4': Mock(),
-            'Heading5': Mock(),
-            'Heading6': Mock()
-        }
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         writer = PDFWriter()
 
@@ -395,25 +474,17 @@ class TestPDFWriter:
             document = Document()
             heading = document.add_heading(f"Heading {level}", level=level)
 
-            result = writer._convert_heading(heading, mock_styles_dict)
+            result = writer._convert_heading(heading, pdf_styles)
 
             # Verify correct style was used
-            expected_style = mock_styles_dict[f'Heading{level}']
+            expected_style = pdf_styles[f'Heading{level}']
             mock_paragraph.assert_called_with(f"Heading {level}", expected_style)
 
     @patch('src.writers.pdf_writer.Paragraph')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
-    def test_heading_level_fallback(self, mock_styles, mock_paragraph):
+    def test_heading_level_fallback(self, mock_styles, mock_paragraph, pdf_styles):
         """Test heading level fallback for levels beyond 6."""
-        mock_styles_dict = {
-            'Heading1': Mock(),
-            'Heading2': Mock(),
-            'Heading3': Mock(),
-            'Heading4': Mock(),
-            'Heading5': Mock(),
-            'Heading6': Mock()
-        }
-        mock_styles.return_value = mock_styles_dict
+        mock_styles.return_value = pdf_styles
 
         writer = PDFWriter()
 
@@ -425,16 +496,17 @@ class TestPDFWriter:
                 self.element_type = ElementType.HEADING
 
         heading = MockHeading()
-        result = writer._convert_heading(heading, mock_styles_dict)
+        result = writer._convert_heading(heading, pdf_styles)
 
         # Should fall back to Heading6
-        mock_paragraph.assert_called_with("Deep Heading", mock_styles_dict['Heading6'])
+        mock_paragraph.assert_called_with("Deep Heading", pdf_styles['Heading6'])
 
     @patch('src.writers.pdf_writer.BaseDocTemplate')
     @patch('src.writers.pdf_writer.getSampleStyleSheet')
     @patch('src.writers.pdf_writer.Spacer')
     @patch('src.writers.pdf_writer.Paragraph')
-    def test_spacing_between_elements(self, mock_paragraph, mock_spacer, mock_styles, mock_doc_template):
+    def test_spacing_between_elements(self, mock_paragraph, mock_spacer, mock_styles,
+                                      mock_doc_template, pdf_styles):
         """Test that spacing is added between elements."""
         mock_pdf_doc = Mock()
         mock_pdf_doc.leftMargin = 72
@@ -443,10 +515,7 @@ class TestPDFWriter:
         mock_pdf_doc.height = 648
         mock_doc_template.return_value = mock_pdf_doc
 
-        # Create properly configured style mocks
-        mock_normal_style = Mock()
-        mock_normal_style.fontName = 'Helvetica'
-        mock_styles.return_value = {'Normal': mock_normal_style}
+        mock_styles.return_value = pdf_styles
 
         document = Document()
         document.add_paragraph("Paragraph 1")
@@ -458,3 +527,32 @@ class TestPDFWriter:
 
         # Verify Spacer was called (at least once for spacing between elements)
         assert mock_spacer.call_count >= 1
+
+    def test_plain_paragraph_matches_parsed_paragraph(self):
+        """Test that plain text skips the parser but yields the same fragments."""
+        from reportlab.platypus import Paragraph
+
+        styles = _get_style_sheet()
+        for style_name in ('Normal', 'Heading1', 'Title'):
+            style = styles[style_name]
+            text = "  Plain text\nwith   extra spacing  "
+
+            _make_paragraph("warm", style)  # parses the style's template once
+
+            with patch('reportlab.platypus.paragraph.ParaParser') as mock_parser:
+                fast = _make_paragraph(text, style)
+            mock_parser.assert_not_called()
+
+            parsed = Paragraph(text, style)
+
+            assert fast.text == parsed.text
+            assert [vars(frag) for frag in fast.frags] == [vars(frag) for frag in parsed.frags]
+
+    def test_markup_paragraph_is_parsed(self):
+        """Test that text with markup or entities still goes through the parser."""
+        style = _get_style_sheet()['Normal']
+
+        paragraph = _make_paragraph("<b>Bold</b> &amp; plain", style)
+
+        assert "".join(frag.text for frag in paragraph.frags) == "Bold & plain"
+        assert paragraph.frags[0].bold